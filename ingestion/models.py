@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
 
 
 @dataclass(frozen=True)
@@ -82,3 +89,28 @@ class MinuteGasObservation:
         record = asdict(self)
         record["minute_utc"] = self.minute_utc.isoformat()
         return record
+
+
+def write_observations_jsonl(path: str | Path, observations: list) -> str:
+    """Write observations to a JSONL file, one record per line.
+
+    Both branches serialize ``to_record()`` output, so line layout and
+    timestamp format do not depend on whether orjson is installed; orjson
+    is still preferred because it emits bytes directly instead of encoding
+    a str per row.
+    """
+    output_path = Path(path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with output_path.open("wb") as handle:
+        if orjson is not None:
+            for row in observations:
+                handle.write(
+                    orjson.dumps(row.to_record(), option=orjson.OPT_APPEND_NEWLINE)
+                )
+        else:
+            for row in observations:
+                handle.write(json.dumps(row.to_record()).encode("utf-8"))
+                handle.write(b"\n")
+
+    return str(output_path)
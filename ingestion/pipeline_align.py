@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import json
 import math
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import pyarrow as pa
 import pyarrow.parquet as pq
 
+try:
+    from numba import njit
+except ModuleNotFoundError:  # pragma: no cover - numba is optional
+    njit = None
+
 from ingestion.transforms.time_align import (
     align_records_to_minute_index,
     build_minute_index,
@@ -28,6 +36,8 @@ def _load_records(path: str) -> list[dict[str, Any]]:
         return payload
     if file_path.suffix == ".parquet":
         return pq.read_table(file_path).to_pylist()
+    if file_path.suffix == ".feather":
+        return pa.ipc.open_file(str(file_path)).read_all().to_pylist()
     raise ValueError(f"unsupported artifact format: {path}")
 
 
@@ -198,7 +208,7 @@ def _normalize_gas_rows(raw_rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 
 def _pick_source_file(files: dict[str, str], key_prefix: str) -> str | None:
-    for suffix in ("parquet", "json"):
+    for suffix in ("parquet", "feather", "json"):
         key = f"{key_prefix}_{suffix}"
         if key in files:
             return files[key]
@@ -236,6 +246,116 @@ def _as_valid_price(value: Any) -> float | None:
     return parsed
 
 
+def _as_float(value: Any) -> float:
+    if value is None:
+        return math.nan
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return math.nan
+    return parsed
+
+
+@dataclass(frozen=True)
+class AlignedFrame:
+    """Column-oriented (SoA) view of aligned minute records.
+
+    One NumPy array per column with NaN coding missing values, so
+    downstream metrics reduce to vectorized comparisons instead of
+    per-row dict lookups on boxed floats. ``list[dict]`` records remain
+    the serialization boundary; build this view with ``from_records``.
+    """
+
+    minute_ts: np.ndarray
+    coinbase_close: np.ndarray
+    uniswap5_token0_price: np.ndarray
+    uniswap30_token0_price: np.ndarray
+    uniswap5_age_since_last_trade_min: np.ndarray
+    uniswap30_age_since_last_trade_min: np.ndarray
+
+    def __len__(self) -> int:
+        return self.minute_ts.shape[0]
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> AlignedFrame:
+        """Build the columnar view in a single pass over the records."""
+        count = len(records)
+        minute_ts = np.empty(count, dtype=np.int64)
+        columns = {
+            key: np.empty(count)
+            for key in (
+                "coinbase_close",
+                "uniswap5_token0_price",
+                "uniswap30_token0_price",
+                "uniswap5_age_since_last_trade_min",
+                "uniswap30_age_since_last_trade_min",
+            )
+        }
+        for idx, row in enumerate(records):
+            minute_ts[idx] = int(_parse_minute_utc(row["minute_utc"]).timestamp())
+            for key, column in columns.items():
+                column[idx] = _as_float(row.get(key))
+        return cls(minute_ts=minute_ts, **columns)
+
+
+def _forward_fill_with_age(
+    minute_ts: np.ndarray,
+    prices: np.ndarray,
+    cex_prices: np.ndarray,
+    min_cex_ratio: float,
+    max_cex_ratio: float,
+    max_jump_ratio: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Carry-forward scan kernel over NaN-coded price arrays.
+
+    Returns (filled_price, age_minutes, outlier_flags); NaN in
+    filled_price means "leave the row untouched" and -1 in age_minutes
+    means "no price observed yet".
+    """
+    count = minute_ts.shape[0]
+    filled = np.full(count, np.nan)
+    ages = np.full(count, -1, dtype=np.int64)
+    outliers = np.zeros(count, dtype=np.bool_)
+
+    last_price = np.nan
+    last_ts = np.int64(0)
+
+    for idx in range(count):
+        observed = prices[idx]
+        is_outlier = False
+
+        if not np.isnan(observed):
+            cex_price = cex_prices[idx]
+            if not np.isnan(cex_price):
+                ratio = observed / cex_price
+                if ratio < min_cex_ratio or ratio > max_cex_ratio:
+                    is_outlier = True
+            if not is_outlier and not np.isnan(last_price):
+                jump_ratio = observed / last_price
+                if jump_ratio < (1.0 / max_jump_ratio) or jump_ratio > max_jump_ratio:
+                    is_outlier = True
+
+        outliers[idx] = is_outlier
+        if is_outlier:
+            observed = np.nan
+
+        if not np.isnan(observed):
+            last_price = observed
+            last_ts = minute_ts[idx]
+            filled[idx] = observed
+            ages[idx] = 0
+        elif not np.isnan(last_price):
+            age_minutes = (minute_ts[idx] - last_ts) // 60
+            filled[idx] = last_price
+            ages[idx] = age_minutes if age_minutes > 0 else 0
+
+    return filled, ages, outliers
+
+
+if njit is not None:
+    _forward_fill_with_age = njit(cache=True)(_forward_fill_with_age)
+
+
 def _forward_fill_uniswap_mid_prices(records: list[dict[str, Any]]) -> None:
     configs = (
         (
@@ -253,47 +373,32 @@ def _forward_fill_uniswap_mid_prices(records: list[dict[str, Any]]) -> None:
     max_cex_ratio = 1.5
     max_jump_ratio = 10.0
 
-    for price_key, age_key, outlier_key in configs:
-        last_price: float | None = None
-        last_trade_minute: datetime | None = None
+    def _price_array(key: str) -> np.ndarray:
+        out = np.empty(len(records))
+        for idx, row in enumerate(records):
+            value = _as_valid_price(row.get(key))
+            out[idx] = np.nan if value is None else value
+        return out
 
-        for row in records:
-            minute = _parse_minute_utc(row["minute_utc"])
-            observed_price = _as_valid_price(row.get(price_key))
-            is_outlier = False
-
-            if observed_price is not None:
-                cex_price = _as_valid_price(row.get("coinbase_close"))
-                if cex_price is not None:
-                    ratio = observed_price / cex_price
-                    if ratio < min_cex_ratio or ratio > max_cex_ratio:
-                        is_outlier = True
-
-                if not is_outlier and last_price is not None:
-                    jump_ratio = observed_price / last_price
-                    if (
-                        jump_ratio < (1.0 / max_jump_ratio)
-                        or jump_ratio > max_jump_ratio
-                    ):
-                        is_outlier = True
-
-            row[outlier_key] = is_outlier
-            if is_outlier:
-                observed_price = None
-
-            if observed_price is not None:
-                last_price = observed_price
-                last_trade_minute = minute
-                row[price_key] = observed_price
-                row[age_key] = 0
-                continue
+    minute_ts = np.empty(len(records), dtype=np.int64)
+    for idx, row in enumerate(records):
+        minute_ts[idx] = int(_parse_minute_utc(row["minute_utc"]).timestamp())
+    cex_prices = _price_array("coinbase_close")
 
-            if last_price is not None and last_trade_minute is not None:
-                age_minutes = int((minute - last_trade_minute).total_seconds() // 60)
-                row[price_key] = last_price
-                row[age_key] = max(0, age_minutes)
-            else:
-                row[age_key] = None
+    for price_key, age_key, outlier_key in configs:
+        filled, ages, outliers = _forward_fill_with_age(
+            minute_ts,
+            _price_array(price_key),
+            cex_prices,
+            min_cex_ratio,
+            max_cex_ratio,
+            max_jump_ratio,
+        )
+        for idx, row in enumerate(records):
+            row[outlier_key] = bool(outliers[idx])
+            if not math.isnan(filled[idx]):
+                row[price_key] = float(filled[idx])
+            row[age_key] = int(ages[idx]) if ages[idx] >= 0 else None
 
     for row in records:
         row.setdefault("uniswap5_fee_tier_bps", 5)
@@ -367,48 +472,47 @@ def _patch_single_minute_uniswap_spikes(records: list[dict[str, Any]]) -> None:
             row[patch_flag_key] = True
 
 
-def build_aligned_from_raw_run(
+def build_aligned_from_dicts(
+    artifacts: dict[str, list[dict[str, Any]]],
     *,
-    raw_run_log_path: str | None = None,
-    output_json_path: str = "data/interim/aligned_records.json",
+    start_time_utc: datetime | str,
+    end_time_utc: datetime | str,
     duplicate_policy: str = "last",
-) -> str:
-    """Build aligned minute records from one raw ingestion run log."""
-    run_log_path = raw_run_log_path or _latest_raw_run_log()
-    run_log = json.loads(Path(run_log_path).read_text(encoding="utf-8"))
-
-    start_time_utc = _parse_timestamp(run_log["start_time_utc"])
-    end_time_utc = _parse_timestamp(run_log["end_time_utc"])
-    minute_index = build_minute_index(start_time_utc, end_time_utc)
+) -> list[dict[str, Any]]:
+    """Build aligned minute records from in-memory raw source rows.
 
-    files: dict[str, str] = run_log.get("files", {})
+    ``artifacts`` keys follow the run-log prefixes: ``coinbase``,
+    ``ethereum_rpc``, ``uniswap_5bps``, and ``uniswap_30bps``; absent
+    keys are treated like missing artifacts.
+    """
+    start = _parse_timestamp(start_time_utc)
+    end = _parse_timestamp(end_time_utc)
+    minute_index = build_minute_index(start, end)
 
     source_maps: dict[str, dict[datetime, dict[str, Any]]] = {}
 
-    coinbase_file = _pick_source_file(files, "coinbase")
-    if coinbase_file:
-        coinbase_rows = _normalize_coinbase_rows(_load_records(coinbase_file))
+    coinbase_raw = artifacts.get("coinbase")
+    if coinbase_raw is not None:
         source_maps["coinbase"] = align_records_to_minute_index(
             minute_index,
-            coinbase_rows,
+            _normalize_coinbase_rows(coinbase_raw),
             timestamp_key="timestamp_utc",
             duplicate_policy=duplicate_policy,
         )
 
-    gas_file = _pick_source_file(files, "ethereum_rpc")
-    if gas_file:
-        gas_rows = _normalize_gas_rows(_load_records(gas_file))
+    gas_raw = artifacts.get("ethereum_rpc")
+    if gas_raw is not None:
         source_maps["gas"] = align_records_to_minute_index(
             minute_index,
-            gas_rows,
+            _normalize_gas_rows(gas_raw),
             timestamp_key="timestamp_utc",
             duplicate_policy=duplicate_policy,
         )
 
-    uni5_file = _pick_source_file(files, "uniswap_5bps")
-    if uni5_file:
+    uni5_raw = artifacts.get("uniswap_5bps")
+    if uni5_raw is not None:
         uni5_rows = _aggregate_uniswap_rows_to_minutes(
-            _normalize_uniswap_rows(_load_records(uni5_file)),
+            _normalize_uniswap_rows(uni5_raw),
             duplicate_policy=duplicate_policy,
         )
         source_maps["uniswap5"] = align_records_to_minute_index(
@@ -418,10 +522,10 @@ def build_aligned_from_raw_run(
             duplicate_policy=duplicate_policy,
         )
 
-    uni30_file = _pick_source_file(files, "uniswap_30bps")
-    if uni30_file:
+    uni30_raw = artifacts.get("uniswap_30bps")
+    if uni30_raw is not None:
         uni30_rows = _aggregate_uniswap_rows_to_minutes(
-            _normalize_uniswap_rows(_load_records(uni30_file)),
+            _normalize_uniswap_rows(uni30_raw),
             duplicate_policy=duplicate_policy,
         )
         source_maps["uniswap30"] = align_records_to_minute_index(
@@ -435,6 +539,33 @@ def build_aligned_from_raw_run(
     records = rows_to_records(aligned_rows)
     _forward_fill_uniswap_mid_prices(records)
     _patch_single_minute_uniswap_spikes(records)
+    return records
+
+
+def build_aligned_from_raw_run(
+    *,
+    raw_run_log_path: str | None = None,
+    output_json_path: str = "data/interim/aligned_records.json",
+    duplicate_policy: str = "last",
+) -> str:
+    """Build aligned minute records from one raw ingestion run log."""
+    run_log_path = raw_run_log_path or _latest_raw_run_log()
+    run_log = json.loads(Path(run_log_path).read_text(encoding="utf-8"))
+
+    files: dict[str, str] = run_log.get("files", {})
+
+    artifacts: dict[str, list[dict[str, Any]]] = {}
+    for key_prefix in ("coinbase", "ethereum_rpc", "uniswap_5bps", "uniswap_30bps"):
+        source_file = _pick_source_file(files, key_prefix)
+        if source_file:
+            artifacts[key_prefix] = _load_records(source_file)
+
+    records = build_aligned_from_dicts(
+        artifacts,
+        start_time_utc=run_log["start_time_utc"],
+        end_time_utc=run_log["end_time_utc"],
+        duplicate_policy=duplicate_policy,
+    )
 
     output_path = Path(output_json_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -8,9 +8,13 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from ingestion.pipeline_align import build_aligned_from_raw_run
+import numpy as np
+import pyarrow.parquet as pq
+
+from ingestion.pipeline_align import AlignedFrame, build_aligned_from_raw_run
 from ingestion.pipeline_processed import ProcessedRunResult, run_processed_pipeline
 from ingestion.pipeline_raw import RawIngestionResult, run_raw_ingestion
+from ingestion.serialization import loads_json, loads_msgpack_frames
 from ingestion.validation import ValidationError
 
 
@@ -25,8 +29,12 @@ class FullRunResult:
     quality_issue_count: int
 
 
-def _read_json_list(path: str) -> list[dict[str, Any]]:
-    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+def _read_record_list(path: str) -> list[dict[str, Any]]:
+    if Path(path).suffix == ".parquet":
+        return pq.read_table(path).to_pylist()
+    if Path(path).suffix == ".mp":
+        return loads_msgpack_frames(Path(path).read_bytes())
+    payload = loads_json(Path(path).read_bytes())
     if not isinstance(payload, list):
         raise ValueError(f"expected list payload in {path}")
     rows: list[dict[str, Any]] = []
@@ -47,7 +55,7 @@ def _to_float(value: Any) -> float | None:
 
 
 def evaluate_alignment_quality(
-    aligned_records: list[dict[str, Any]],
+    aligned: AlignedFrame | list[dict[str, Any]],
     *,
     min_uniswap5_coverage: float = 0.9,
     min_uniswap30_coverage: float = 0.05,
@@ -55,8 +63,17 @@ def evaluate_alignment_quality(
     max_uniswap5_stale_share: float = 0.5,
     max_uniswap30_stale_share: float = 0.95,
 ) -> tuple[dict[str, Any], list[dict[str, str]]]:
-    """Compute coverage/staleness metrics and return warning-like issues."""
-    total = len(aligned_records)
+    """Compute coverage/staleness metrics and return warning-like issues.
+
+    Accepts the columnar ``AlignedFrame`` directly; ``list[dict]``
+    records are converted once on entry.
+    """
+    frame = (
+        aligned
+        if isinstance(aligned, AlignedFrame)
+        else AlignedFrame.from_records(aligned)
+    )
+    total = len(frame)
     if total == 0:
         metrics = {
             "total_minutes": 0,
@@ -72,33 +89,31 @@ def evaluate_alignment_quality(
         ]
         return metrics, issues
 
-    uni5_present = sum(
-        1
-        for row in aligned_records
-        if _to_float(row.get("uniswap5_token0_price")) is not None
+    # NaN codes missing values, so presence and staleness fall out of
+    # single vectorized comparisons (NaN > threshold is False).
+    uni5_cov = (
+        int(np.count_nonzero(~np.isnan(frame.uniswap5_token0_price))) / total
     )
-    uni30_present = sum(
-        1
-        for row in aligned_records
-        if _to_float(row.get("uniswap30_token0_price")) is not None
+    uni30_cov = (
+        int(np.count_nonzero(~np.isnan(frame.uniswap30_token0_price))) / total
     )
-    uni5_cov = uni5_present / total
-    uni30_cov = uni30_present / total
 
-    uni5_stale = sum(
-        1
-        for row in aligned_records
-        if (_to_float(row.get("uniswap5_age_since_last_trade_min")) or -1)
-        > staleness_threshold_minutes
+    uni5_stale_share = (
+        int(
+            np.count_nonzero(
+                frame.uniswap5_age_since_last_trade_min > staleness_threshold_minutes
+            )
+        )
+        / total
     )
-    uni30_stale = sum(
-        1
-        for row in aligned_records
-        if (_to_float(row.get("uniswap30_age_since_last_trade_min")) or -1)
-        > staleness_threshold_minutes
+    uni30_stale_share = (
+        int(
+            np.count_nonzero(
+                frame.uniswap30_age_since_last_trade_min > staleness_threshold_minutes
+            )
+        )
+        / total
     )
-    uni5_stale_share = uni5_stale / total
-    uni30_stale_share = uni30_stale / total
 
     metrics = {
         "total_minutes": total,
@@ -241,7 +256,7 @@ def run_full_pipeline(
         raw_run_log_path=raw_result.files.get("run_log"),
         output_json_path=interim_output_json,
     )
-    aligned_records = _read_json_list(aligned_json_path)
+    aligned_records = _read_record_list(aligned_json_path)
     quality_metrics, quality_issues = evaluate_alignment_quality(
         aligned_records,
         min_uniswap5_coverage=min_uniswap5_coverage,
@@ -265,7 +280,7 @@ def run_full_pipeline(
         annualization_minutes=annualization_minutes,
         fail_on_warnings=fail_on_warnings,
     )
-    dataset_rows = _read_json_list(processed_result.dataset_json_path)
+    dataset_rows = _read_record_list(processed_result.dataset_json_path)
 
     summary_payload = {
         "run_time_utc": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
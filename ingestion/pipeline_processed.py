@@ -11,6 +11,7 @@ from typing import Any
 from ingestion.dataset_builder import build_dataset_rows
 from ingestion.export import ExportResult, export_records
 from ingestion.reporting import build_missingness_report, write_missingness_report
+from ingestion.serialization import dumps_msgpack_frames
 from ingestion.validation import ValidationError, enforce_validation
 
 
@@ -18,7 +19,7 @@ from ingestion.validation import ValidationError, enforce_validation
 class ProcessedRunResult:
     """Artifacts and summary from a processed dataset export run."""
 
-    dataset_json_path: str
+    dataset_json_path: str | None
     report_json_path: str
     parquet_path: str
     metadata_path: str
@@ -59,8 +60,20 @@ def run_processed_pipeline(
     realized_vol_window: int = 30,
     annualization_minutes: int = 525_600,
     fail_on_warnings: bool = False,
+    emit_json: bool = True,
+    dataset_format: str = "json",
 ) -> ProcessedRunResult:
-    """Shape dataset, validate output, emit report, and export parquet."""
+    """Shape dataset, validate output, emit report, and export parquet.
+
+    Set ``emit_json=False`` to skip the row-oriented dataset copy; the
+    parquet artifact is then the only dataset output and
+    ``dataset_json_path`` is None. ``dataset_format="msgpack"`` writes
+    length-prefixed MessagePack frames to a ``.dataset.mp`` file instead
+    of JSON; ``dataset_json_path`` then points at that file.
+    """
+    if dataset_format not in {"json", "msgpack"}:
+        raise ValueError("dataset_format must be 'json' or 'msgpack'")
+
     processed_dir = Path(output_dir)
     processed_dir.mkdir(parents=True, exist_ok=True)
 
@@ -152,14 +165,22 @@ def run_processed_pipeline(
     )
 
     run_tag = Path(export_result.parquet_path).stem
-    dataset_json_path = processed_dir / f"{run_tag}.dataset.json"
     report_json_path = processed_dir / f"{run_tag}.missingness.json"
 
-    dataset_json_path.write_text(json.dumps(dataset_rows, indent=2), encoding="utf-8")
+    dataset_json_path: Path | None = None
+    if emit_json:
+        if dataset_format == "msgpack":
+            dataset_json_path = processed_dir / f"{run_tag}.dataset.mp"
+            dataset_json_path.write_bytes(dumps_msgpack_frames(dataset_rows))
+        else:
+            dataset_json_path = processed_dir / f"{run_tag}.dataset.json"
+            dataset_json_path.write_text(
+                json.dumps(dataset_rows, indent=2), encoding="utf-8"
+            )
     write_missingness_report(str(report_json_path), report)
 
     return ProcessedRunResult(
-        dataset_json_path=str(dataset_json_path),
+        dataset_json_path=str(dataset_json_path) if emit_json else None,
         report_json_path=str(report_json_path),
         parquet_path=export_result.parquet_path,
         metadata_path=export_result.metadata_path,
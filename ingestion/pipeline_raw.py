@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 import json
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -47,19 +48,57 @@ def _run_id(now: datetime | None = None) -> str:
     return dt.strftime("%Y%m%dT%H%M%SZ")
 
 
-def _write_json(path: Path, payload: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+class FilesystemSink:
+    """Default artifact sink: writes files under the run's output dir."""
 
+    def write_json(self, path: Path, payload: Any) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
-def _write_parquet(path: Path, records: list[dict[str, Any]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    table = pa.Table.from_pylist(records)
-    pq.write_table(table, path)
+    def write_parquet(self, path: Path, records: list[dict[str, Any]]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pylist(records)
+        pq.write_table(table, path)
+
+    def write_feather(self, path: Path, records: list[dict[str, Any]]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pylist(records)
+        with pa.OSFile(str(path), "wb") as stream:
+            with pa.ipc.new_file(stream, table.schema) as writer:
+                writer.write_table(table)
+
+
+class InMemorySink:
+    """Artifact sink that keeps artifact bytes in BytesIO buffers.
+
+    Nothing touches the filesystem; ``buffers`` is keyed by artifact
+    file name while the run result still reports the would-be paths.
+    """
+
+    def __init__(self) -> None:
+        self.buffers: dict[str, io.BytesIO] = {}
+
+    def write_json(self, path: Path, payload: Any) -> None:
+        self.buffers[path.name] = io.BytesIO(
+            json.dumps(payload, indent=2).encode("utf-8")
+        )
+
+    def write_parquet(self, path: Path, records: list[dict[str, Any]]) -> None:
+        stream = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pylist(records), stream)
+        self.buffers[path.name] = io.BytesIO(stream.getvalue().to_pybytes())
+
+    def write_feather(self, path: Path, records: list[dict[str, Any]]) -> None:
+        table = pa.Table.from_pylist(records)
+        stream = pa.BufferOutputStream()
+        with pa.ipc.new_file(stream, table.schema) as writer:
+            writer.write_table(table)
+        self.buffers[path.name] = io.BytesIO(stream.getvalue().to_pybytes())
 
 
 def _persist_records(
     *,
+    sink: FilesystemSink | InMemorySink,
     base_path: Path,
     records: list[dict[str, Any]],
     raw_format: str,
@@ -67,12 +106,16 @@ def _persist_records(
     files: dict[str, str] = {}
     if raw_format in {"json", "both"}:
         json_path = base_path.with_suffix(".json")
-        _write_json(json_path, records)
+        sink.write_json(json_path, records)
         files["json"] = str(json_path)
     if raw_format in {"parquet", "both"}:
         parquet_path = base_path.with_suffix(".parquet")
-        _write_parquet(parquet_path, records)
+        sink.write_parquet(parquet_path, records)
         files["parquet"] = str(parquet_path)
+    if raw_format == "feather":
+        feather_path = base_path.with_suffix(".feather")
+        sink.write_feather(feather_path, records)
+        files["feather"] = str(feather_path)
     return files
 
 
@@ -94,11 +137,19 @@ def run_raw_ingestion(
     rpc_feehistory_blocks_per_request: int = 1024,
     rpc_progress_every_blocks: int = 1000,
     raw_format: str = "parquet",
+    artifact_sink: FilesystemSink | InMemorySink | None = None,
 ) -> RawIngestionResult:
-    """Run raw source ingestion and persist outputs under data/raw."""
+    """Run raw source ingestion and persist outputs under data/raw.
+
+    ``artifact_sink`` overrides where artifact bytes land; the default
+    FilesystemSink writes files under ``output_dir``. ``raw_format``
+    "feather" emits uncompressed Arrow IPC files; "both" still means
+    json plus parquet.
+    """
     logger = get_logger()
-    if raw_format not in {"json", "parquet", "both"}:
-        raise ValueError("raw_format must be one of: json, parquet, both")
+    if raw_format not in {"json", "parquet", "feather", "both"}:
+        raise ValueError("raw_format must be one of: json, parquet, feather, both")
+    sink = artifact_sink if artifact_sink is not None else FilesystemSink()
     run_id = _run_id()
     raw_dir = Path(output_dir)
 
@@ -120,6 +171,7 @@ def run_raw_ingestion(
             end_time_utc=end_time_utc,
         )
         artifact_5 = _persist_records(
+            sink=sink,
             base_path=raw_dir / f"uniswap_swaps_5bps_{run_id}",
             records=swaps_5,
             raw_format=raw_format,
@@ -137,6 +189,7 @@ def run_raw_ingestion(
             end_time_utc=end_time_utc,
         )
         artifact_30 = _persist_records(
+            sink=sink,
             base_path=raw_dir / f"uniswap_swaps_30bps_{run_id}",
             records=swaps_30,
             raw_format=raw_format,
@@ -158,6 +211,7 @@ def run_raw_ingestion(
     )
     coinbase_records = coinbase_observations_to_records(coinbase_rows)
     coinbase_artifacts = _persist_records(
+        sink=sink,
         base_path=raw_dir / f"coinbase_{coinbase_product_id}_{run_id}",
         records=coinbase_records,
         raw_format=raw_format,
@@ -167,6 +221,7 @@ def run_raw_ingestion(
     row_counts["coinbase"] = len(coinbase_records)
     logger.info("raw ingestion wrote %s rows for coinbase", len(coinbase_records))
 
+    block_window: tuple[int, int] | None = None
     if rpc_url:
         rpc_client = UrllibEthereumRPCClient(rpc_url=rpc_url)
         eth_rows = fetch_basefee_observations(
@@ -179,6 +234,7 @@ def run_raw_ingestion(
         )
         eth_records = ethereum_observations_to_records(eth_rows)
         eth_artifacts = _persist_records(
+            sink=sink,
             base_path=raw_dir / f"ethereum_blocks_{run_id}",
             records=eth_records,
             raw_format=raw_format,
@@ -186,6 +242,9 @@ def run_raw_ingestion(
         for ext, path in eth_artifacts.items():
             files[f"ethereum_rpc_{ext}"] = path
         row_counts["ethereum_rpc"] = len(eth_records)
+        if eth_records:
+            blocks = [int(record["block_number"]) for record in eth_records]
+            block_window = (min(blocks), max(blocks))
         logger.info("raw ingestion wrote %s rows for ethereum_rpc", len(eth_records))
 
     run_log = {
@@ -196,8 +255,14 @@ def run_raw_ingestion(
         "row_counts": row_counts,
         "files": files,
     }
+    if block_window is not None:
+        # Recorded so downstream checks can skip re-reading the artifact.
+        run_log["block_window"] = {
+            "from_block": block_window[0],
+            "to_block": block_window[1],
+        }
     run_log_file = raw_dir / f"raw_ingestion_run_{run_id}.json"
-    _write_json(run_log_file, run_log)
+    sink.write_json(run_log_file, run_log)
     files["run_log"] = str(run_log_file)
     logger.info("raw ingestion run log written to %s", run_log_file)
 
@@ -0,0 +1,65 @@
+"""Binary serialization helpers for dataset artifacts."""
+
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any
+
+try:
+    import msgspec
+except ModuleNotFoundError:  # pragma: no cover - msgspec is optional
+    msgspec = None
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def _require_msgspec() -> None:
+    if msgspec is None:
+        raise RuntimeError("msgspec is required for msgpack dataset artifacts")
+
+
+def dumps_msgpack_frames(rows: list[dict[str, Any]]) -> bytes:
+    """Encode rows as length-prefixed MessagePack frames.
+
+    Each row becomes ``<4-byte big-endian length><msgpack frame>``, so
+    readers can walk the buffer frame by frame without materializing
+    one giant document.
+    """
+    _require_msgspec()
+    encoder = msgspec.msgpack.Encoder()
+    buffer = bytearray()
+    frame = bytearray()
+    for row in rows:
+        encoder.encode_into(row, frame)
+        buffer += _FRAME_HEADER.pack(len(frame))
+        buffer += frame
+    return bytes(buffer)
+
+
+def loads_msgpack_frames(data: bytes) -> list[dict[str, Any]]:
+    """Decode length-prefixed MessagePack frames back into rows."""
+    _require_msgspec()
+    decoder = msgspec.msgpack.Decoder()
+    rows: list[dict[str, Any]] = []
+    offset = 0
+    while offset < len(data):
+        (length,) = _FRAME_HEADER.unpack_from(data, offset)
+        offset += _FRAME_HEADER.size
+        rows.append(decoder.decode(data[offset : offset + length]))
+        offset += length
+    return rows
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode JSON bytes, preferring msgspec's C decoder when installed."""
+    if msgspec is None:
+        return json.loads(data)
+    return msgspec.json.decode(data)
+
+
+__all__ = [
+    "dumps_msgpack_frames",
+    "loads_json",
+    "loads_msgpack_frames",
+]
@@ -13,7 +13,17 @@ from typing import Any
 from urllib import error, request
 
 from ingestion.models import GasBasefeeObservation, MinuteGasObservation
-from ingestion.utils_time import floor_to_utc_minute, to_utc
+from ingestion.utils_time import to_utc
+
+try:
+    import ijson
+except ModuleNotFoundError:
+    ijson = None
+
+# Responses smaller than this are parsed from a single buffered read; larger
+# bodies (big feeHistory windows) are parsed incrementally while the socket
+# drains, when ijson is available.
+STREAMING_PARSE_MIN_BYTES = 1_048_576
 
 
 class EthereumRPCError(RuntimeError):
@@ -35,6 +45,10 @@ class EthereumRPCClientProtocol:
         """Return eth_feeHistory payload for a contiguous block window."""
         raise NotImplementedError
 
+    def call_batch(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        """Issue several RPC methods as one JSON-RPC batch request."""
+        raise NotImplementedError
+
 
 @dataclass
 class UrllibEthereumRPCClient(EthereumRPCClientProtocol):
@@ -65,6 +79,8 @@ class UrllibEthereumRPCClient(EthereumRPCClientProtocol):
         for attempt in range(1, attempts + 1):
             try:
                 with request.urlopen(req, timeout=self.timeout_seconds) as response:
+                    if _should_stream_parse(response):
+                        return _parse_rpc_response_streaming(response)
                     body = response.read().decode("utf-8")
                 parsed = json.loads(body)
                 if parsed.get("error"):
@@ -87,6 +103,61 @@ class UrllibEthereumRPCClient(EthereumRPCClientProtocol):
             raise last_error
         raise RuntimeError("unreachable retry state")
 
+    def call_batch(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        payload = [
+            {"jsonrpc": "2.0", "id": index, "method": method, "params": params}
+            for index, (method, params) in enumerate(calls)
+        ]
+        req = request.Request(
+            self.rpc_url,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+        attempts = max(1, self.max_retries)
+        last_error: Exception | None = None
+
+        for attempt in range(1, attempts + 1):
+            try:
+                with request.urlopen(req, timeout=self.timeout_seconds) as response:
+                    body = response.read().decode("utf-8")
+                parsed = json.loads(body)
+                if isinstance(parsed, Mapping):
+                    # Providers that reject batching answer with a lone error
+                    # object instead of an array.
+                    raise EthereumRPCError(f"RPC error: {parsed.get('error')}")
+                if not isinstance(parsed, list) or len(parsed) != len(calls):
+                    raise EthereumRPCError("unexpected batch response shape")
+
+                results: list[Any] = [None] * len(calls)
+                for entry in parsed:
+                    if not isinstance(entry, Mapping):
+                        raise EthereumRPCError("unexpected batch entry payload")
+                    if entry.get("error"):
+                        raise EthereumRPCError(f"RPC error: {entry['error']}")
+                    entry_id = entry.get("id")
+                    if not isinstance(entry_id, int) or not 0 <= entry_id < len(calls):
+                        raise EthereumRPCError("batch entry id out of range")
+                    if "result" not in entry:
+                        raise EthereumRPCError("RPC response missing result")
+                    results[entry_id] = entry["result"]
+                return results
+            except error.HTTPError as exc:
+                if not _is_retryable_http_error(exc) or attempt >= attempts:
+                    raise
+                last_error = exc
+            except (error.URLError, TimeoutError) as exc:
+                if attempt >= attempts:
+                    raise
+                last_error = exc
+
+            time.sleep(self.retry_backoff_seconds * attempt)
+
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("unreachable retry state")
+
     def get_latest_block_number(self) -> int:
         result = self._rpc_call("eth_blockNumber", [])
         return int(result, 16)
@@ -109,6 +180,33 @@ class UrllibEthereumRPCClient(EthereumRPCClientProtocol):
         return result
 
 
+def _should_stream_parse(response: Any) -> bool:
+    if ijson is None:
+        return False
+    content_length = getattr(response, "headers", {}).get("Content-Length")
+    if content_length is None:
+        return False
+    try:
+        return int(content_length) >= STREAMING_PARSE_MIN_BYTES
+    except ValueError:
+        return False
+
+
+def _parse_rpc_response_streaming(response: Any) -> Any:
+    """Parse a JSON-RPC response incrementally while the body is received."""
+    result: Any = None
+    has_result = False
+    for key, value in ijson.kvitems(response, ""):
+        if key == "error" and value:
+            raise EthereumRPCError(f"RPC error: {value}")
+        if key == "result":
+            result = value
+            has_result = True
+    if not has_result:
+        raise EthereumRPCError("RPC response missing result")
+    return result
+
+
 def _is_retryable_http_error(exc: error.HTTPError) -> bool:
     return exc.code == 429 or exc.code >= 500
 
@@ -140,15 +238,41 @@ def parse_block_basefee(block: Mapping[str, Any]) -> GasBasefeeObservation:
     )
 
 
+# Mainnet post-merge block cadence; used to estimate a lower search bound.
+_SECONDS_PER_BLOCK_ESTIMATE = 12
+_BLOCK_ESTIMATE_SAFETY_MARGIN = 1000
+
+
 def _find_first_block_at_or_after(
     client: EthereumRPCClientProtocol,
     *,
     target_timestamp_unix: int,
     latest_block_number: int,
+    latest_timestamp_unix: int | None = None,
 ) -> int:
     low = 0
     high = latest_block_number + 1
 
+    if latest_timestamp_unix is not None:
+        if target_timestamp_unix > latest_timestamp_unix:
+            return latest_block_number + 1
+        # Recent windows do not need to bisect from genesis: estimate how far
+        # back the target sits from the tip and start the search just below
+        # that, after verifying the estimate does not overshoot the target.
+        blocks_back = (
+            latest_timestamp_unix - target_timestamp_unix
+        ) // _SECONDS_PER_BLOCK_ESTIMATE
+        estimated_low = (
+            latest_block_number - blocks_back - _BLOCK_ESTIMATE_SAFETY_MARGIN
+        )
+        if estimated_low > 0:
+            probe_block = client.get_block_by_number(estimated_low)
+            if (
+                probe_block is not None
+                and _hex_to_int(probe_block.get("timestamp")) < target_timestamp_unix
+            ):
+                low = estimated_low
+
     while low < high:
         mid = (low + high) // 2
         block = client.get_block_by_number(mid)
@@ -213,11 +337,13 @@ def fetch_basefee_observations(
         client,
         target_timestamp_unix=start_ts,
         latest_block_number=latest_block_number,
+        latest_timestamp_unix=latest_timestamp,
     )
     first_after_end_block = _find_first_block_at_or_after(
         client,
         target_timestamp_unix=end_ts + 1,
         latest_block_number=latest_block_number,
+        latest_timestamp_unix=latest_timestamp,
     )
     end_block = min(first_after_end_block - 1, latest_block_number)
 
@@ -345,7 +471,12 @@ def _fetch_basefee_observations_feehistory(
     while chunk_start <= end_block:
         chunk_end = min(chunk_start + blocks_per_request - 1, end_block)
         chunk_count = chunk_end - chunk_start + 1
-        history = client.get_fee_history(chunk_count, chunk_end)
+        history, start_block_payload, end_block_payload = _fetch_feehistory_chunk(
+            client,
+            chunk_start=chunk_start,
+            chunk_end=chunk_end,
+            chunk_count=chunk_count,
+        )
         oldest_block, base_fees_wei, gas_used_ratios = _parse_fee_history(history)
         if oldest_block != chunk_start:
             raise EthereumRPCError(
@@ -357,12 +488,6 @@ def _fetch_basefee_observations_feehistory(
         if len(base_fees_wei) < chunk_count:
             raise EthereumRPCError("feeHistory baseFeePerGas length mismatch")
 
-        start_block_payload = client.get_block_by_number(chunk_start)
-        end_block_payload = (
-            start_block_payload
-            if chunk_count == 1
-            else client.get_block_by_number(chunk_end)
-        )
         if start_block_payload is None or end_block_payload is None:
             raise EthereumRPCError("feeHistory timestamp anchors missing block payload")
 
@@ -425,6 +550,50 @@ def _fetch_basefee_observations_feehistory(
     return sorted(rows, key=lambda row: row.block_number)
 
 
+def _fetch_feehistory_chunk(
+    client: EthereumRPCClientProtocol,
+    *,
+    chunk_start: int,
+    chunk_end: int,
+    chunk_count: int,
+) -> tuple[Mapping[str, Any], Mapping[str, Any] | None, Mapping[str, Any] | None]:
+    """Fetch feeHistory plus its timestamp anchor blocks for one chunk.
+
+    Clients that support JSON-RPC batching answer all three calls in a
+    single round trip; others fall back to sequential requests. Providers
+    that disable batching answer the batch POST with an error object, which
+    surfaces as EthereumRPCError and also retries the chunk sequentially.
+    """
+    calls: list[tuple[str, list[Any]]] = [
+        ("eth_feeHistory", [_to_hex(chunk_count), _to_hex(chunk_end), []]),
+        ("eth_getBlockByNumber", [_to_hex(chunk_start), False]),
+    ]
+    if chunk_count > 1:
+        calls.append(("eth_getBlockByNumber", [_to_hex(chunk_end), False]))
+
+    try:
+        results = client.call_batch(calls)
+    except (AttributeError, NotImplementedError, EthereumRPCError):
+        history = client.get_fee_history(chunk_count, chunk_end)
+        start_block_payload = client.get_block_by_number(chunk_start)
+        end_block_payload = (
+            start_block_payload
+            if chunk_count == 1
+            else client.get_block_by_number(chunk_end)
+        )
+        return history, start_block_payload, end_block_payload
+
+    history = results[0]
+    if not isinstance(history, Mapping):
+        raise EthereumRPCError("unexpected feeHistory payload")
+    start_block_payload = results[1]
+    end_block_payload = start_block_payload if chunk_count == 1 else results[2]
+    for payload in (start_block_payload, end_block_payload):
+        if payload is not None and not isinstance(payload, Mapping):
+            raise EthereumRPCError("unexpected block payload")
+    return history, start_block_payload, end_block_payload
+
+
 def _parse_fee_history(
     payload: Mapping[str, Any],
 ) -> tuple[int, list[int], list[float]]:
@@ -450,34 +619,42 @@ def _parse_fee_history(
 def aggregate_basefee_to_minutes(
     observations: list[GasBasefeeObservation],
 ) -> list[MinuteGasObservation]:
-    """Aggregate blocks to minute UTC using latest block in each minute."""
+    """Aggregate blocks to minute UTC using latest block in each minute.
+
+    Implemented as one pandas sort/groupby so minute bucketing stays
+    columnar instead of building per-minute Python lists.
+    """
     if not observations:
         return []
 
-    buckets: dict[datetime, list[GasBasefeeObservation]] = {}
-    for row in observations:
-        minute = floor_to_utc_minute(row.timestamp_utc)
-        buckets.setdefault(minute, []).append(row)
+    import pandas as pd
 
-    minute_rows: list[MinuteGasObservation] = []
-    for minute in sorted(buckets):
-        minute_blocks = sorted(
-            buckets[minute],
-            key=lambda row: (row.timestamp_utc, row.block_number),
+    frame = pd.DataFrame.from_records(row.__dict__ for row in observations)
+    frame["timestamp_utc"] = pd.to_datetime(frame["timestamp_utc"], utc=True)
+    frame["minute_utc"] = frame["timestamp_utc"].dt.floor("min")
+    frame = frame.sort_values(
+        ["minute_utc", "timestamp_utc", "block_number"], kind="stable"
+    )
+
+    grouped = frame.groupby("minute_utc", sort=True)
+    block_counts = grouped.size()
+    latest_per_minute = grouped.tail(1)
+
+    return [
+        MinuteGasObservation(
+            minute_utc=minute.to_pydatetime(),
+            base_fee_per_gas_wei=int(row.base_fee_per_gas_wei),
+            gas_used=int(row.gas_used),
+            gas_limit=int(row.gas_limit),
+            block_number=int(row.block_number),
+            block_count=int(block_counts.loc[minute]),
         )
-        chosen = minute_blocks[-1]
-        minute_rows.append(
-            MinuteGasObservation(
-                minute_utc=minute,
-                base_fee_per_gas_wei=chosen.base_fee_per_gas_wei,
-                gas_used=chosen.gas_used,
-                gas_limit=chosen.gas_limit,
-                block_number=chosen.block_number,
-                block_count=len(minute_blocks),
-            )
+        for minute, row in zip(
+            latest_per_minute["minute_utc"],
+            latest_per_minute.itertuples(index=False),
+            strict=True,
         )
-
-    return minute_rows
+    ]
 
 
 def observations_to_records(
@@ -2,19 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import heapq
 import json
 import time
 from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 from urllib import error, request
 
 from ingestion.models import UniswapMinuteObservation
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 GRAPH_GATEWAY_BASE_URL = "https://gateway.thegraph.com/api"
 MAINNET_NETWORK_LABEL = "ethereum-mainnet"
 
+# Epoch anchor for unix -> datetime conversion; adding a timedelta to a
+# tz-aware base is markedly faster than datetime.fromtimestamp(tz=UTC)
+# in the per-row parse loop.
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+
 POOL_MINUTE_QUERY = """
 query PoolMinutePage(
   $pool: String!,
@@ -39,20 +54,69 @@ query PoolMinutePage(
 }
 """
 
-POOL_SWAPS_QUERY = """
-query PoolSwapsPage(
+# Cursor-paginated variants. High skip values make the subgraph re-scan all
+# preceding rows server-side, so deep pulls degrade quadratically; advancing
+# a timestamp cursor with skip pinned at zero keeps each page O(page_size).
+POOL_MINUTE_QUERY_CURSOR = """
+query PoolMinutePageAfter(
   $pool: String!,
-  $start: Int!,
+  $afterTs: Int!,
   $end: Int!,
-  $first: Int!,
-  $skip: Int!
+  $first: Int!
+) {
+  poolMinuteDatas(
+    first: $first
+    orderBy: periodStartUnix
+    orderDirection: asc
+    where: {pool: $pool, periodStartUnix_gt: $afterTs, periodStartUnix_lte: $end}
+  ) {
+    periodStartUnix
+    token0Price
+    token1Price
+    volumeUSD
+    tvlUSD
+  }
+}
+"""
+
+POOL_SWAPS_QUERY_CURSOR = """
+query PoolSwapsPageAfter(
+  $pool: String!,
+  $afterTs: Int!,
+  $end: Int!,
+  $first: Int!
 ) {
   swaps(
     first: $first
-    skip: $skip
     orderBy: timestamp
     orderDirection: asc
-    where: {pool: $pool, timestamp_gte: $start, timestamp_lte: $end}
+    where: {pool: $pool, timestamp_gt: $afterTs, timestamp_lte: $end}
+  ) {
+    id
+    timestamp
+    amount0
+    amount1
+    amountUSD
+    sqrtPriceX96
+  }
+}
+"""
+
+# Drains one boundary second completely. The subgraph does not order ties on
+# timestamp deterministically, so within a second the unique swap id is the
+# only safe cursor.
+POOL_SWAPS_SECOND_QUERY = """
+query PoolSwapsWithinSecond(
+  $pool: String!,
+  $ts: Int!,
+  $afterId: ID!,
+  $first: Int!
+) {
+  swaps(
+    first: $first
+    orderBy: id
+    orderDirection: asc
+    where: {pool: $pool, timestamp: $ts, id_gt: $afterId}
   ) {
     id
     timestamp
@@ -88,8 +152,7 @@ class UrllibGraphClient(GraphClientProtocol):
     retry_backoff_seconds: float = 0.5
 
     def post_json(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
-        payload_dict = {"query": query, "variables": dict(variables)}
-        payload = json.dumps(payload_dict).encode("utf-8")
+        payload = _request_body_bytes(query, variables)
         headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -111,8 +174,8 @@ class UrllibGraphClient(GraphClientProtocol):
         for attempt in range(1, attempts + 1):
             try:
                 with request.urlopen(req, timeout=self.timeout_seconds) as response:
-                    body = response.read().decode("utf-8")
-                parsed = json.loads(body)
+                    body = response.read()
+                parsed = _json_loads(body)
                 ensure_graph_response_ok(parsed)
                 return parsed
             except error.HTTPError as exc:
@@ -131,6 +194,275 @@ class UrllibGraphClient(GraphClientProtocol):
         raise RuntimeError("unreachable retry state")
 
 
+class PooledGraphClient(GraphClientProtocol):
+    """GraphQL client backed by a urllib3 keep-alive connection pool.
+
+    urlopen opens a fresh TCP+TLS connection per page, so multi-page pulls
+    pay a handshake on every request; a pooled client reuses the connection
+    for every page after the first.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        api_key: str | None = None,
+        timeout_seconds: int = 30,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 0.5,
+    ) -> None:
+        try:
+            import urllib3
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("urllib3 is required for PooledGraphClient") from exc
+        self._urllib3 = urllib3
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.timeout_seconds = timeout_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "research-project-ingestion/0.1 (+https://local)",
+        }
+        if api_key and f"/{api_key}/" not in endpoint:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        # Retries are handled here so backoff matches UrllibGraphClient.
+        self._http = urllib3.PoolManager(num_pools=4, maxsize=8, retries=False)
+
+    def post_json(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        payload = _request_body_bytes(query, variables)
+
+        attempts = max(1, self.max_retries)
+        last_error: Exception | None = None
+
+        for attempt in range(1, attempts + 1):
+            try:
+                response = self._http.request(
+                    "POST",
+                    self.endpoint,
+                    body=payload,
+                    headers=self._headers,
+                    timeout=self.timeout_seconds,
+                )
+            except self._urllib3.exceptions.HTTPError as exc:
+                if attempt >= attempts:
+                    raise
+                last_error = exc
+            else:
+                if response.status == 429 or response.status >= 500:
+                    if attempt >= attempts:
+                        raise GraphAPIError(
+                            f"Graph returned HTTP {response.status}"
+                        )
+                    last_error = GraphAPIError(
+                        f"Graph returned HTTP {response.status}"
+                    )
+                else:
+                    parsed = _json_loads(response.data)
+                    ensure_graph_response_ok(parsed)
+                    return parsed
+
+            time.sleep(self.retry_backoff_seconds * attempt)
+
+        if last_error is not None:
+            raise last_error
+        raise RuntimeError("unreachable retry state")
+
+
+class AiohttpGraphClient:
+    """GraphQL client using aiohttp, enabling concurrent page fetches."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        api_key: str | None = None,
+        timeout_seconds: int = 30,
+    ) -> None:
+        try:
+            import aiohttp
+        except ModuleNotFoundError as exc:
+            raise RuntimeError("aiohttp is required for AiohttpGraphClient") from exc
+        self._aiohttp = aiohttp
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.timeout_seconds = timeout_seconds
+        self._session: Any = None
+
+    async def __aenter__(self) -> "AiohttpGraphClient":
+        timeout = self._aiohttp.ClientTimeout(total=self.timeout_seconds)
+        self._session = self._aiohttp.ClientSession(timeout=timeout)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        del exc_type, exc, tb
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def post_json_async(
+        self, query: str, variables: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        """Submit one GraphQL payload and return decoded JSON."""
+        if self._session is None:
+            raise RuntimeError("AiohttpGraphClient must be used as an async context")
+
+        payload = _request_body_bytes(query, variables)
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "User-Agent": "research-project-ingestion/0.1 (+https://local)",
+        }
+        if self.api_key and f"/{self.api_key}/" not in self.endpoint:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        async with self._session.post(
+            self.endpoint, data=payload, headers=headers
+        ) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+        parsed = _json_loads(body)
+        ensure_graph_response_ok(parsed)
+        return parsed
+
+
+async def fetch_pool_minutes_async(
+    client: AiohttpGraphClient,
+    *,
+    pool_id: str,
+    fee_tier_bps: int,
+    start_time_utc: datetime,
+    end_time_utc: datetime,
+    page_size: int = 1000,
+    max_in_flight: int = 8,
+) -> list[UniswapMinuteObservation]:
+    """Fetch minute observations with speculative concurrent pagination.
+
+    While the lowest-skip page is awaited, up to max_in_flight later pages
+    are requested concurrently so network latency overlaps instead of
+    serializing. Pages are still consumed in skip order; outstanding
+    speculative requests are cancelled once an under-full page arrives.
+
+    This path keeps skip-based pages because speculative requests need
+    offsets known up front; the serial fetch_pool_minutes uses a timestamp
+    cursor instead.
+    """
+    if end_time_utc <= start_time_utc:
+        raise ValueError("end_time_utc must be later than start_time_utc")
+
+    pool_lc = pool_id.lower()
+    start_unix = int(start_time_utc.astimezone(UTC).timestamp())
+    end_unix = int(end_time_utc.astimezone(UTC).timestamp())
+
+    all_rows: list[UniswapMinuteObservation] = []
+    pending: dict[int, asyncio.Task] = {}
+    next_skip = 0
+
+    try:
+        while True:
+            while len(pending) < max_in_flight:
+                variables = {
+                    "pool": pool_lc,
+                    "start": start_unix,
+                    "end": end_unix,
+                    "first": page_size,
+                    "skip": next_skip,
+                }
+                pending[next_skip] = asyncio.create_task(
+                    client.post_json_async(POOL_MINUTE_QUERY, variables)
+                )
+                next_skip += page_size
+
+            lowest_skip = min(pending)
+            payload = await pending.pop(lowest_skip)
+            page_rows = parse_pool_minute_page(
+                payload,
+                pool_id=pool_id,
+                fee_tier_bps=fee_tier_bps,
+                _skip_validation=True,
+            )
+            all_rows.extend(page_rows)
+            if len(page_rows) < page_size:
+                break
+    finally:
+        for task in pending.values():
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    # Pages arrive ordered by periodStartUnix asc and are consumed in skip
+    # order, so the concatenated rows are already sorted.
+    return all_rows
+
+
+def fetch_pool_minutes_concurrent(
+    *,
+    endpoint: str,
+    api_key: str | None = None,
+    pool_id: str,
+    fee_tier_bps: int,
+    start_time_utc: datetime,
+    end_time_utc: datetime,
+    page_size: int = 1000,
+    max_in_flight: int = 8,
+    timeout_seconds: int = 30,
+) -> list[UniswapMinuteObservation]:
+    """Synchronous wrapper around fetch_pool_minutes_async."""
+
+    async def _run() -> list[UniswapMinuteObservation]:
+        async with AiohttpGraphClient(
+            endpoint, api_key=api_key, timeout_seconds=timeout_seconds
+        ) as client:
+            return await fetch_pool_minutes_async(
+                client,
+                pool_id=pool_id,
+                fee_tier_bps=fee_tier_bps,
+                start_time_utc=start_time_utc,
+                end_time_utc=end_time_utc,
+                page_size=page_size,
+                max_in_flight=max_in_flight,
+            )
+
+    return asyncio.run(_run())
+
+
+def _json_dumps_bytes(payload: Any) -> bytes:
+    """Serialize a request payload to UTF-8 bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@lru_cache(maxsize=8)
+def _query_prefix_bytes(query: str) -> bytes:
+    """Serialized {"query": ...} minus the closing brace, cached per query.
+
+    The handful of fixed GraphQL strings dominate request bodies, so each is
+    encoded once and the per-request variables are spliced in after it.
+    """
+    return _json_dumps_bytes({"query": query})[:-1]
+
+
+def _request_body_bytes(query: str, variables: Mapping[str, Any]) -> bytes:
+    """Assemble a GraphQL POST body from the cached query prefix."""
+    return (
+        _query_prefix_bytes(query)
+        + b',"variables":'
+        + _json_dumps_bytes(dict(variables))
+        + b"}"
+    )
+
+
+def _json_loads(body: bytes) -> Any:
+    """Deserialize a response body, via orjson when available."""
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def _is_retryable_http_error(exc: error.HTTPError) -> bool:
     return exc.code == 429 or exc.code >= 500
 
@@ -174,22 +506,29 @@ def parse_pool_minute_page(
     *,
     pool_id: str,
     fee_tier_bps: int,
+    _skip_validation: bool = False,
 ) -> list[UniswapMinuteObservation]:
-    """Parse one Graph response page into normalized observations."""
-    ensure_graph_response_ok(payload)
+    """Parse one Graph response page into normalized observations.
+
+    Clients already run ensure_graph_response_ok on every response, so the
+    fetch loops pass _skip_validation to avoid re-checking each page.
+    """
+    if not _skip_validation:
+        ensure_graph_response_ok(payload)
 
     try:
         raw_rows = payload["data"]["poolMinuteDatas"]
     except (KeyError, TypeError) as exc:
         raise ValueError("unexpected Graph payload shape") from exc
 
+    pool_lc = pool_id.lower()
     observations: list[UniswapMinuteObservation] = []
     for row in raw_rows:
-        ts = datetime.fromtimestamp(int(row["periodStartUnix"]), tz=UTC)
+        ts = _EPOCH_UTC + timedelta(seconds=int(row["periodStartUnix"]))
         observations.append(
             UniswapMinuteObservation(
                 timestamp_utc=ts,
-                pool_id=pool_id.lower(),
+                pool_id=pool_lc,
                 fee_tier_bps=fee_tier_bps,
                 token0_price=float(row["token0Price"]),
                 token1_price=float(row["token1Price"]),
@@ -201,6 +540,70 @@ def parse_pool_minute_page(
     return observations
 
 
+def parse_pool_minute_page_df(
+    payload: Mapping[str, Any],
+    *,
+    pool_id: str,
+    fee_tier_bps: int,
+) -> Any:
+    """Parse one Graph response page straight into a pandas DataFrame.
+
+    Skips the per-row dataclass and record dicts entirely, so callers that
+    immediately pandaize the output avoid N intermediate objects; dtype
+    casting happens columnwise instead of per value.
+    """
+    try:
+        import numpy as np
+        import pandas as pd
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("pandas is required for DataFrame parsing") from exc
+
+    ensure_graph_response_ok(payload)
+
+    try:
+        raw_rows = payload["data"]["poolMinuteDatas"]
+    except (KeyError, TypeError) as exc:
+        raise ValueError("unexpected Graph payload shape") from exc
+
+    df = pd.DataFrame(raw_rows, columns=list(_MINUTE_COLUMN_RENAMES))
+    df["timestamp_utc"] = pd.to_datetime(
+        df.pop("periodStartUnix").astype("int64"), unit="s", utc=True
+    )
+    df = df.rename(columns=_MINUTE_COLUMN_RENAMES).astype(
+        {
+            "token0_price": "float64",
+            "token1_price": "float64",
+            "volume_usd": "float64",
+            "tvl_usd": "float64",
+        }
+    )
+    df["pool_id"] = pool_id.lower()
+    df["fee_tier_bps"] = np.int32(fee_tier_bps)
+    df["source"] = "the_graph"
+    # Same column order as the dataclass record path.
+    return df[
+        [
+            "timestamp_utc",
+            "pool_id",
+            "fee_tier_bps",
+            "token0_price",
+            "token1_price",
+            "volume_usd",
+            "tvl_usd",
+            "source",
+        ]
+    ]
+
+
+_MINUTE_COLUMN_RENAMES = {
+    "periodStartUnix": "periodStartUnix",
+    "token0Price": "token0_price",
+    "token1Price": "token1_price",
+    "volumeUSD": "volume_usd",
+    "tvlUSD": "tvl_usd",
+}
+
+
 def fetch_pool_minutes(
     client: GraphClientProtocol,
     *,
@@ -214,27 +617,30 @@ def fetch_pool_minutes(
     if end_time_utc <= start_time_utc:
         raise ValueError("end_time_utc must be later than start_time_utc")
 
+    pool_lc = pool_id.lower()
     start_unix = int(start_time_utc.astimezone(UTC).timestamp())
     end_unix = int(end_time_utc.astimezone(UTC).timestamp())
 
     all_rows: list[UniswapMinuteObservation] = []
-    skip = 0
+    # Cursor pagination: periodStartUnix is unique per pool minute, so the
+    # last timestamp seen is a complete cursor with no duplicate risk.
+    after_ts = start_unix - 1
 
     while True:
         payload = client.post_json(
-            POOL_MINUTE_QUERY,
+            POOL_MINUTE_QUERY_CURSOR,
             {
-                "pool": pool_id.lower(),
-                "start": start_unix,
+                "pool": pool_lc,
+                "afterTs": after_ts,
                 "end": end_unix,
                 "first": page_size,
-                "skip": skip,
             },
         )
         page_rows = parse_pool_minute_page(
             payload,
             pool_id=pool_id,
             fee_tier_bps=fee_tier_bps,
+            _skip_validation=True,
         )
         if not page_rows:
             break
@@ -242,9 +648,92 @@ def fetch_pool_minutes(
         all_rows.extend(page_rows)
         if len(page_rows) < page_size:
             break
-        skip += page_size
+        after_ts = int(page_rows[-1].timestamp_utc.timestamp())
+
+    # Pages arrive ordered by periodStartUnix asc and the cursor only moves
+    # forward, so the concatenated rows are already sorted.
+    return all_rows
+
+
+def fetch_pool_minutes_cached(
+    client: GraphClientProtocol,
+    *,
+    cache_dir: str | Path,
+    pool_id: str,
+    fee_tier_bps: int,
+    start_time_utc: datetime,
+    end_time_utc: datetime,
+    page_size: int = 1000,
+) -> list[UniswapMinuteObservation]:
+    """Fetch minute observations through a disk-backed Parquet cache.
+
+    Minute data for a fully-closed window is immutable upstream, so warm
+    re-runs read one Parquet file instead of re-paging the network. Windows
+    whose end is still in the future bypass the cache. The cache key covers
+    the whole window; day-level partitioning is not worth the bookkeeping at
+    this project's window sizes.
+    """
+    try:
+        import pandas as pd
+    except ModuleNotFoundError as exc:
+        raise RuntimeError("pandas is required for the minute cache") from exc
+
+    start_unix = int(start_time_utc.astimezone(UTC).timestamp())
+    end_unix = int(end_time_utc.astimezone(UTC).timestamp())
+    window_closed = end_unix < int(time.time())
+
+    cache_dir = Path(cache_dir)
+    key = hashlib.blake2b(
+        f"{pool_id.lower()}|{fee_tier_bps}|{start_unix}|{end_unix}|{page_size}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    cache_path = cache_dir / f"pool_minutes_{key}.parquet"
+
+    if window_closed and cache_path.exists():
+        frame = pd.read_parquet(cache_path)
+        # timestamp_utc is persisted as the record-path ISO string.
+        return [
+            UniswapMinuteObservation(
+                timestamp_utc=datetime.fromisoformat(row.timestamp_utc),
+                pool_id=row.pool_id,
+                fee_tier_bps=int(row.fee_tier_bps),
+                token0_price=row.token0_price,
+                token1_price=row.token1_price,
+                volume_usd=row.volume_usd,
+                tvl_usd=row.tvl_usd,
+                source=row.source,
+            )
+            for row in frame.itertuples(index=False)
+        ]
+
+    observations = fetch_pool_minutes(
+        client,
+        pool_id=pool_id,
+        fee_tier_bps=fee_tier_bps,
+        start_time_utc=start_time_utc,
+        end_time_utc=end_time_utc,
+        page_size=page_size,
+    )
 
-    return sorted(all_rows, key=lambda row: row.timestamp_utc)
+    if window_closed:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        frame = observations_to_dataframe(observations)
+        if not observations:
+            frame = frame.reindex(
+                columns=[
+                    "timestamp_utc",
+                    "pool_id",
+                    "fee_tier_bps",
+                    "token0_price",
+                    "token1_price",
+                    "volume_usd",
+                    "tvl_usd",
+                    "source",
+                ]
+            )
+        frame.to_parquet(cache_path, index=False)
+
+    return observations
 
 
 def fetch_two_fee_tiers(
@@ -256,23 +745,26 @@ def fetch_two_fee_tiers(
     page_size: int = 1000,
 ) -> list[UniswapMinuteObservation]:
     """Fetch minute observations for multiple configured fee tiers."""
-    merged: list[UniswapMinuteObservation] = []
-    for fee_tier_bps in sorted(pools_by_fee_tier_bps):
-        pool_id = pools_by_fee_tier_bps[fee_tier_bps]
-        merged.extend(
-            fetch_pool_minutes(
-                client,
-                pool_id=pool_id,
-                fee_tier_bps=fee_tier_bps,
-                start_time_utc=start_time_utc,
-                end_time_utc=end_time_utc,
-                page_size=page_size,
-            )
+    ordered_fee_tiers = sorted(pools_by_fee_tier_bps)
+    streams: list[list[UniswapMinuteObservation]] = [
+        fetch_pool_minutes(
+            client,
+            pool_id=pools_by_fee_tier_bps[fee_tier_bps],
+            fee_tier_bps=fee_tier_bps,
+            start_time_utc=start_time_utc,
+            end_time_utc=end_time_utc,
+            page_size=page_size,
+        )
+        for fee_tier_bps in ordered_fee_tiers
+    ]
+
+    # Each per-tier stream is already sorted by timestamp, so a k-way merge
+    # is linear instead of re-sorting the concatenation.
+    return list(
+        heapq.merge(
+            *streams,
+            key=lambda row: (row.timestamp_utc, row.fee_tier_bps, row.pool_id),
         )
-
-    return sorted(
-        merged,
-        key=lambda row: (row.timestamp_utc, row.fee_tier_bps, row.pool_id),
     )
 
 
@@ -288,36 +780,83 @@ def fetch_pool_swaps_raw(
     if end_time_utc <= start_time_utc:
         raise ValueError("end_time_utc must be later than start_time_utc")
 
+    pool_lc = pool_id.lower()
     start_unix = int(start_time_utc.astimezone(UTC).timestamp())
     end_unix = int(end_time_utc.astimezone(UTC).timestamp())
-    skip = 0
     rows: list[dict[str, Any]] = []
+    # Swap timestamps are not unique, so a full page is only trusted up to
+    # its final second: rows in that boundary second are re-fetched through
+    # an id cursor, which cannot drop or duplicate swaps even when a single
+    # second holds more than page_size of them.
+    after_ts = start_unix - 1
 
     while True:
         payload = client.post_json(
-            POOL_SWAPS_QUERY,
+            POOL_SWAPS_QUERY_CURSOR,
             {
-                "pool": pool_id.lower(),
-                "start": start_unix,
+                "pool": pool_lc,
+                "afterTs": after_ts,
                 "end": end_unix,
                 "first": page_size,
-                "skip": skip,
             },
         )
-        ensure_graph_response_ok(payload)
         page_rows = payload.get("data", {}).get("swaps", [])
         if not isinstance(page_rows, list):
             raise ValueError("unexpected swaps payload shape")
-        if not page_rows:
-            break
-        rows.extend(page_rows)
+
         if len(page_rows) < page_size:
+            rows.extend(page_rows)
             break
-        skip += page_size
 
+        boundary_ts = int(page_rows[-1]["timestamp"])
+        rows.extend(row for row in page_rows if int(row["timestamp"]) < boundary_ts)
+        rows.extend(
+            _fetch_swaps_within_second(
+                client,
+                pool_id=pool_lc,
+                timestamp_unix=boundary_ts,
+                page_size=page_size,
+            )
+        )
+        after_ts = boundary_ts
+
+    # Within-second order from the boundary queries is by id; apply the same
+    # (timestamp, id) order everywhere so output is deterministic.
+    rows.sort(key=lambda row: (int(row["timestamp"]), row["id"]))
     return rows
 
 
+def _fetch_swaps_within_second(
+    client: GraphClientProtocol,
+    *,
+    pool_id: str,
+    timestamp_unix: int,
+    page_size: int,
+) -> list[dict[str, Any]]:
+    """Fetch every swap in one second, paging on the unique swap id."""
+    rows: list[dict[str, Any]] = []
+    after_id = ""
+
+    while True:
+        payload = client.post_json(
+            POOL_SWAPS_SECOND_QUERY,
+            {
+                "pool": pool_id,
+                "ts": timestamp_unix,
+                "afterId": after_id,
+                "first": page_size,
+            },
+        )
+        page_rows = payload.get("data", {}).get("swaps", [])
+        if not isinstance(page_rows, list):
+            raise ValueError("unexpected swaps payload shape")
+
+        rows.extend(page_rows)
+        if len(page_rows) < page_size:
+            return rows
+        after_id = page_rows[-1]["id"]
+
+
 def observations_to_records(
     observations: list[UniswapMinuteObservation],
 ) -> list[dict[str, object]]:
@@ -326,7 +865,7 @@ def observations_to_records(
 
 
 def observations_to_dataframe(
-    observations: list[UniswapMinuteObservation],
+    observations: list[UniswapMinuteObservation] | Any,
 ) -> Any:
     """Convert observations into a pandas DataFrame when pandas is available."""
     try:
@@ -334,4 +873,8 @@ def observations_to_dataframe(
     except ModuleNotFoundError as exc:
         raise RuntimeError("pandas is required for DataFrame conversion") from exc
 
+    # Input from parse_pool_minute_page_df is already columnar.
+    if isinstance(observations, pd.DataFrame):
+        return observations
+
     return pd.DataFrame(observations_to_records(observations))
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
+import pandas as pd
+
 from ingestion.utils_time import floor_to_utc_minute, to_utc
 
 
@@ -17,13 +20,17 @@ class AlignedRow:
     values: dict[str, Any]
 
 
-def build_minute_index(
+def build_minute_index_unix(
     start_time_utc: datetime,
     end_time_utc: datetime,
     *,
     end_inclusive: bool = True,
-) -> list[datetime]:
-    """Build canonical UTC minute grid from start floor to end boundary."""
+) -> np.ndarray:
+    """Build the canonical minute grid as int64 unix seconds.
+
+    An int64 array is ~6x smaller than the equivalent list of tz-aware
+    datetimes and supports vectorized alignment via searchsorted.
+    """
     start_minute = floor_to_utc_minute(to_utc(start_time_utc))
     end_minute = floor_to_utc_minute(to_utc(end_time_utc))
 
@@ -33,15 +40,33 @@ def build_minute_index(
         stop = end_minute - timedelta(minutes=1)
 
     if stop < start_minute:
-        return []
+        return np.empty(0, dtype="int64")
+
+    start_unix = int(start_minute.timestamp())
+    stop_unix = int(stop.timestamp())
+    return np.arange(start_unix, stop_unix + 60, 60, dtype="int64")
 
-    minutes: list[datetime] = []
-    current = start_minute
-    while current <= stop:
-        minutes.append(current)
-        current = current + timedelta(minutes=1)
 
-    return minutes
+def minute_index_to_datetimes(minute_index_unix: np.ndarray) -> list[datetime]:
+    """Adapt an int64 unix-seconds grid to Python datetimes for dict keying."""
+    grid = pd.to_datetime(minute_index_unix, unit="s", utc=True)
+    return list(grid.to_pydatetime())
+
+
+def build_minute_index(
+    start_time_utc: datetime,
+    end_time_utc: datetime,
+    *,
+    end_inclusive: bool = True,
+) -> list[datetime]:
+    """Build canonical UTC minute grid from start floor to end boundary."""
+    return minute_index_to_datetimes(
+        build_minute_index_unix(
+            start_time_utc,
+            end_time_utc,
+            end_inclusive=end_inclusive,
+        )
+    )
 
 
 def normalize_timestamp_to_minute(ts: datetime) -> datetime:
@@ -60,6 +85,9 @@ def align_records_to_minute_index(
     if duplicate_policy not in {"last", "first"}:
         raise ValueError("duplicate_policy must be 'last' or 'first'")
 
+    # O(1) membership tests instead of scanning the minute list per record.
+    index_set = frozenset(minute_index)
+
     normalized: dict[datetime, dict[str, Any]] = {}
     for record in records:
         raw_ts = record[timestamp_key]
@@ -71,7 +99,7 @@ def align_records_to_minute_index(
             raise ValueError("record timestamp must be str or datetime")
 
         minute = normalize_timestamp_to_minute(parsed)
-        if minute not in minute_index:
+        if minute not in index_set:
             continue
 
         payload = {k: v for k, v in record.items() if k != timestamp_key}
@@ -83,21 +111,93 @@ def align_records_to_minute_index(
     return normalized
 
 
+def align_records_to_minute_index_unix(
+    minute_index_unix: np.ndarray,
+    records: list[dict[str, Any]],
+    *,
+    timestamp_key: str,
+    duplicate_policy: str = "last",
+) -> dict[int, dict[str, Any]]:
+    """Align records onto an int64 minute grid, keyed by unix seconds.
+
+    Membership against the grid is one vectorized searchsorted over all
+    record timestamps instead of a per-record set probe.
+    """
+    if duplicate_policy not in {"last", "first"}:
+        raise ValueError("duplicate_policy must be 'last' or 'first'")
+    if not records or minute_index_unix.size == 0:
+        return {}
+
+    record_ts = np.empty(len(records), dtype="int64")
+    for position, record in enumerate(records):
+        raw_ts = record[timestamp_key]
+        if isinstance(raw_ts, str):
+            parsed = datetime.fromisoformat(raw_ts.replace("Z", "+00:00"))
+        elif isinstance(raw_ts, datetime):
+            parsed = raw_ts
+        else:
+            raise ValueError("record timestamp must be str or datetime")
+        record_ts[position] = int(normalize_timestamp_to_minute(parsed).timestamp())
+
+    insert_at = np.searchsorted(minute_index_unix, record_ts)
+    insert_at = np.minimum(insert_at, minute_index_unix.size - 1)
+    in_grid = minute_index_unix[insert_at] == record_ts
+
+    normalized: dict[int, dict[str, Any]] = {}
+    for position in np.flatnonzero(in_grid):
+        minute_unix = int(record_ts[position])
+        record = records[position]
+        payload = {k: v for k, v in record.items() if k != timestamp_key}
+        if minute_unix not in normalized or duplicate_policy == "last":
+            normalized[minute_unix] = payload
+
+    return normalized
+
+
+def aligned_map_to_datetimes(
+    aligned_map: dict[int, dict[str, Any]],
+) -> dict[datetime, dict[str, Any]]:
+    """Adapt a unix-keyed aligned map to datetime keys for merge helpers."""
+    return {
+        datetime.fromtimestamp(minute_unix, tz=UTC): payload
+        for minute_unix, payload in aligned_map.items()
+    }
+
+
 def merge_aligned_sources(
     minute_index: list[datetime],
     source_maps: dict[str, dict[datetime, dict[str, Any]]],
 ) -> list[AlignedRow]:
     """Merge multiple aligned source maps onto canonical minute rows."""
-    rows: list[AlignedRow] = []
-    for minute in minute_index:
-        merged_values: dict[str, Any] = {}
-        for source_name, aligned_map in source_maps.items():
-            source_values = aligned_map.get(minute, {})
+    # Prefixed column names are computed once per (source, key) instead of
+    # re-evaluating the f-string for every minute.
+    prefixed_keys: dict[str, dict[str, str]] = {}
+    for source_name, aligned_map in source_maps.items():
+        names: dict[str, str] = {}
+        for source_values in aligned_map.values():
+            for key in source_values:
+                if key not in names:
+                    names[key] = f"{source_name}_{key}"
+        prefixed_keys[source_name] = names
+
+    # Walk each source map directly so minutes without data for a source
+    # never allocate or touch an intermediate empty dict.
+    merged_by_minute: dict[datetime, dict[str, Any]] = {
+        minute: {} for minute in minute_index
+    }
+    for source_name, aligned_map in source_maps.items():
+        names = prefixed_keys[source_name]
+        for minute, source_values in aligned_map.items():
+            target = merged_by_minute.get(minute)
+            if target is None:
+                continue
             for key, value in source_values.items():
-                merged_values[f"{source_name}_{key}"] = value
-        rows.append(AlignedRow(minute_utc=minute, values=merged_values))
+                target[names[key]] = value
 
-    return rows
+    return [
+        AlignedRow(minute_utc=minute, values=merged_by_minute[minute])
+        for minute in minute_index
+    ]
 
 
 def missing_minutes_for_source(
@@ -8,6 +8,11 @@ import json
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -40,7 +45,10 @@ def _get_nested(mapping: dict[str, Any], *keys: str) -> Any:
 def main() -> int:
     args = parse_args()
     summary_path = Path(args.summary_json) if args.summary_json else _latest_summary()
-    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary_bytes = summary_path.read_bytes()
+    summary = (
+        orjson.loads(summary_bytes) if orjson is not None else json.loads(summary_bytes)
+    )
     if not isinstance(summary, dict):
         raise ValueError("summary must be a JSON object")
 
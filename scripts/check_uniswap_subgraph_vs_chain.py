@@ -5,20 +5,57 @@ from __future__ import annotations
 
 import argparse
 import json
+import math
 import os
+import random
 import re
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 from urllib import error, request
 
-import pyarrow.parquet as pq
+import numpy as np
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import urllib3
+except ModuleNotFoundError:
+    urllib3 = None
 
 SWAP_TOPIC0 = (
     "0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67"
 )
 
+_POOL_ID_RE = re.compile(r"0x[a-f0-9]{40}")
+
+# orjson decodes numeric-heavy RPC payloads several times faster than the
+# stdlib; both helpers fall back to stdlib json when it is absent.
+def _json_loads(body):
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _json_dumps_bytes(payload):
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+# Keep-alive pool shared by every RPC call so the TLS handshake is paid once
+# per run instead of once per call; falls back to one-shot urlopen without
+# urllib3 installed.
+_POOL = urllib3.PoolManager(maxsize=8, retries=False) if urllib3 else None
+
+_TRANSPORT_ERRORS: tuple[type[Exception], ...] = (error.URLError, TimeoutError)
+if urllib3 is not None:
+    _TRANSPORT_ERRORS = _TRANSPORT_ERRORS + (urllib3.exceptions.HTTPError,)
+
 
 def load_dotenv_fallback() -> None:
     try:
@@ -35,9 +72,11 @@ def load_dotenv_fallback() -> None:
 
     for raw_line in env_path.read_text(encoding="utf-8").splitlines():
         line = raw_line.strip()
-        if not line or line.startswith("#") or "=" not in line:
+        if not line or line.startswith("#"):
+            continue
+        key, separator, value = line.partition("=")
+        if not separator:
             continue
-        key, value = line.split("=", 1)
         os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
 
 
@@ -77,7 +116,36 @@ def parse_args() -> argparse.Namespace:
         "--request-sleep-seconds",
         type=float,
         default=0.2,
-        help="Sleep between successful eth_getLogs requests.",
+        help="Minimum spacing between eth_getLogs requests across workers.",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=5,
+        help="Maximum concurrent eth_getLogs batch requests.",
+    )
+    parser.add_argument(
+        "--hypersync-url",
+        default=None,
+        help="HyperSync endpoint; counts logs via the indexer instead of RPC.",
+    )
+    parser.add_argument(
+        "--max-onchain-calls",
+        type=int,
+        default=None,
+        help="Cap on eth_getLogs batch calls; excess windows are sampled.",
+    )
+    parser.add_argument(
+        "--sample-fraction",
+        type=float,
+        default=1.0,
+        help="Fraction of chunk windows to query; the count is scaled up.",
+    )
+    parser.add_argument(
+        "--sample-seed",
+        type=int,
+        default=0,
+        help="Seed for the window sampler, for reproducible estimates.",
     )
     return parser.parse_args()
 
@@ -116,7 +184,7 @@ def _resolve_pool_id(explicit: str | None, fee_tier_bps: int) -> str:
     if not pool_id:
         raise ValueError(f"Set --pool-id or {env_key}.")
     normalized = pool_id.strip().strip('"').strip("'").lower()
-    if not re.fullmatch(r"0x[a-f0-9]{40}", normalized):
+    if not _POOL_ID_RE.fullmatch(normalized):
         raise ValueError(f"Invalid pool id format: {pool_id}")
     return normalized
 
@@ -126,67 +194,191 @@ def _find_artifact(run_log: dict[str, Any], base_key: str) -> Path:
     if not isinstance(files, dict):
         raise ValueError("run log missing files mapping")
 
-    key_candidates = [
-        f"{base_key}_parquet",
-        f"{base_key}_json",
-        base_key,
-    ]
-    for key in key_candidates:
-        path = files.get(key)
-        if isinstance(path, str) and path:
-            return Path(path)
-
-    raise ValueError(f"No artifact path found for {base_key}.")
+    path = next(
+        (
+            Path(files[key])
+            for key in (f"{base_key}_parquet", f"{base_key}_json", base_key)
+            if isinstance(files.get(key), str) and files[key]
+        ),
+        None,
+    )
+    if path is None:
+        raise ValueError(f"No artifact path found for {base_key}.")
+    return path
 
 
 def _read_record_count(path: Path) -> int:
     if path.suffix == ".parquet":
-        return pq.read_table(path).num_rows
-    payload = json.loads(path.read_text(encoding="utf-8"))
+        # Imported lazily so JSON-only runs and --help skip the pyarrow cost.
+        import pyarrow.parquet as pq
+
+        # The footer already stores the row count; no column decode needed.
+        return pq.ParquetFile(path).metadata.num_rows
+    payload = _json_loads(path.read_bytes())
     if not isinstance(payload, list):
         raise ValueError(f"Expected list payload in {path}")
     return len(payload)
 
 
+def _parquet_block_window_from_stats(path: Path) -> tuple[int, int] | None:
+    """Read the block window from row-group statistics, skipping all data pages.
+
+    Returns None when any row group lacks min/max statistics for the
+    block_number column.
+    """
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    if metadata.num_rows == 0:
+        raise ValueError("No block_number values found in ethereum_rpc artifact.")
+
+    try:
+        column_index = parquet_file.schema_arrow.names.index("block_number")
+    except ValueError:
+        return None
+
+    low: int | None = None
+    high: int | None = None
+    for group_index in range(metadata.num_row_groups):
+        statistics = metadata.row_group(group_index).column(column_index).statistics
+        if statistics is None or not statistics.has_min_max:
+            return None
+        group_min = int(statistics.min)
+        group_max = int(statistics.max)
+        low = group_min if low is None else min(low, group_min)
+        high = group_max if high is None else max(high, group_max)
+
+    if low is None or high is None:
+        return None
+    return low, high
+
+
+def _block_window_from_run_log(run_log: dict[str, Any]) -> tuple[int, int] | None:
+    """Return the block window recorded in the run log, if present.
+
+    Newer run logs carry the window directly, which avoids opening the
+    ethereum artifact at all.
+    """
+    window = run_log.get("block_window")
+    if not isinstance(window, dict):
+        return None
+    from_block = window.get("from_block")
+    to_block = window.get("to_block")
+    if isinstance(from_block, int) and isinstance(to_block, int):
+        return from_block, to_block
+    return None
+
+
 def _read_block_window(path: Path) -> tuple[int, int]:
     if path.suffix == ".parquet":
-        rows = pq.read_table(path, columns=["block_number"]).column("block_number")
-        blocks = [int(x) for x in rows.to_pylist()]
-    else:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        if not isinstance(payload, list):
-            raise ValueError(f"Expected list payload in {path}")
-        blocks = [
-            int(item["block_number"]) for item in payload if "block_number" in item
-        ]
+        import pyarrow.compute as pc
+        import pyarrow.parquet as pq
+
+        window = _parquet_block_window_from_stats(path)
+        if window is not None:
+            return window
+        # Statistics were missing; aggregate the column natively in Arrow
+        # instead of boxing every value into a Python int.
+        column = pq.read_table(path, columns=["block_number"]).column("block_number")
+        if len(column) == 0:
+            raise ValueError(
+                "No block_number values found in ethereum_rpc artifact."
+            )
+        bounds = pc.min_max(column).as_py()
+        return int(bounds["min"]), int(bounds["max"])
 
-    if not blocks:
+    payload = _json_loads(path.read_bytes())
+    if not isinstance(payload, list):
+        raise ValueError(f"Expected list payload in {path}")
+    blocks = np.fromiter(
+        (int(item["block_number"]) for item in payload if "block_number" in item),
+        dtype=np.int64,
+    )
+    if blocks.size == 0:
         raise ValueError("No block_number values found in ethereum_rpc artifact.")
-    return min(blocks), max(blocks)
+    return int(blocks.min()), int(blocks.max())
+
 
+# Providers commonly cap JSON-RPC batches at 20 entries (e.g. Moralis).
+MAX_CALLS_PER_BATCH = 20
 
-def _rpc_call(rpc_url: str, method: str, params: list[Any]) -> Any:
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": method,
-        "params": params,
-    }
-    req = request.Request(
+
+def _rpc_call(rpc_url: str, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+    """POST a JSON-RPC 2.0 batch and return results in call order."""
+    payload = [
+        {"jsonrpc": "2.0", "id": index, "method": method, "params": params}
+        for index, (method, params) in enumerate(calls)
+    ]
+    methods = ",".join(sorted({method for method, _ in calls}))
+    return _rpc_post_body(
         rpc_url,
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
+        _json_dumps_bytes(payload),
+        expected_calls=len(calls),
+        methods=methods,
     )
+
+
+def _rpc_post_body(
+    rpc_url: str,
+    data: bytes,
+    *,
+    expected_calls: int,
+    methods: str,
+) -> list[Any]:
+    """POST prebuilt JSON-RPC batch bytes and dispatch results by id."""
+    headers = {"Content-Type": "application/json"}
     attempts = 8
     for attempt in range(1, attempts + 1):
         try:
-            with request.urlopen(req, timeout=60) as response:
-                body = response.read().decode("utf-8")
-            parsed = json.loads(body)
-            if parsed.get("error"):
-                raise RuntimeError(f"RPC error: {parsed['error']}")
-            return parsed["result"]
+            if _POOL is not None:
+                pooled = _POOL.request(
+                    "POST", rpc_url, body=data, headers=headers, timeout=60
+                )
+                if pooled.status >= 400:
+                    retryable_http = pooled.status == 429 or pooled.status >= 500
+                    if retryable_http and attempt < attempts:
+                        time.sleep(min(10.0, 0.75 * (2 ** (attempt - 1))))
+                        continue
+                    detail = pooled.data.decode("utf-8", errors="replace")
+                    if detail:
+                        raise RuntimeError(
+                            f"HTTP {pooled.status} for {methods}: {detail}"
+                        )
+                    raise RuntimeError(f"HTTP {pooled.status} for {methods}")
+                body = pooled.data
+            else:
+                req = request.Request(
+                    rpc_url,
+                    data=data,
+                    headers=headers,
+                    method="POST",
+                )
+                with request.urlopen(req, timeout=60) as response:
+                    body = response.read()
+            parsed = _json_loads(body)
+            if isinstance(parsed, dict):
+                # Some providers reject whole batches with a single object.
+                raise RuntimeError(f"RPC error: {parsed.get('error', parsed)}")
+            if not isinstance(parsed, list) or len(parsed) != expected_calls:
+                raise RuntimeError(
+                    f"RPC batch returned {len(parsed)} entries for "
+                    f"{expected_calls} calls"
+                )
+            by_id: dict[int, dict[str, Any]] = {}
+            for entry in parsed:
+                if not isinstance(entry, dict):
+                    raise RuntimeError("RPC batch entry is not an object")
+                by_id[int(entry["id"])] = entry
+            results: list[Any] = []
+            for index in range(expected_calls):
+                entry = by_id.get(index)
+                if entry is None:
+                    raise RuntimeError(f"RPC batch missing response id {index}")
+                if entry.get("error"):
+                    raise RuntimeError(f"RPC error: {entry['error']}")
+                results.append(entry["result"])
+            return results
         except error.HTTPError as exc:
             body = ""
             try:
@@ -200,16 +392,96 @@ def _rpc_call(rpc_url: str, method: str, params: list[Any]) -> Any:
                 continue
 
             if body:
-                raise RuntimeError(f"HTTP {exc.code} for {method}: {body}") from exc
-            raise RuntimeError(f"HTTP {exc.code} for {method}") from exc
-        except (error.URLError, TimeoutError):
+                raise RuntimeError(f"HTTP {exc.code} for {methods}: {body}") from exc
+            raise RuntimeError(f"HTTP {exc.code} for {methods}") from exc
+        except _TRANSPORT_ERRORS:
             if attempt < attempts:
                 time.sleep(min(10.0, 0.75 * (2 ** (attempt - 1))))
                 continue
-            raise RuntimeError(f"Transport failure for {method}")
+            raise RuntimeError(f"Transport failure for {methods}")
     raise RuntimeError("RPC call retry loop exhausted")
 
 
+def _post_json(url: str, payload: dict[str, Any]) -> Any:
+    data = _json_dumps_bytes(payload)
+    headers = {"Content-Type": "application/json"}
+    if _POOL is not None:
+        response = _POOL.request("POST", url, body=data, headers=headers, timeout=60)
+        if response.status >= 400:
+            detail = response.data.decode("utf-8", errors="replace")
+            raise RuntimeError(f"HTTP {response.status} for {url}: {detail}")
+        return _json_loads(response.data)
+    req = request.Request(url, data=data, headers=headers, method="POST")
+    with request.urlopen(req, timeout=60) as response:
+        return _json_loads(response.read())
+
+
+def _count_swap_logs_hypersync(
+    *,
+    hypersync_url: str,
+    pool_id: str,
+    from_block: int,
+    to_block: int,
+) -> int:
+    """Count swap logs via a HyperSync-style log indexer.
+
+    One pre-indexed scan replaces the O(range/chunk_size) chunked RPC loop;
+    the server paginates through nextBlock until the window is covered.
+    """
+    endpoint = hypersync_url.rstrip("/") + "/query"
+    total = 0
+    current = from_block
+    while current <= to_block:
+        payload = _post_json(
+            endpoint,
+            {
+                "fromBlock": current,
+                # HyperSync's toBlock is exclusive.
+                "toBlock": to_block + 1,
+                "logs": [{"address": [pool_id], "topics": [[SWAP_TOPIC0]]}],
+                "fieldSelection": {"log": ["logIndex"]},
+            },
+        )
+        if not isinstance(payload, dict):
+            raise RuntimeError("unexpected HyperSync response shape")
+        for batch in payload.get("data", []):
+            total += len(batch.get("logs", []))
+        next_block = payload.get("nextBlock")
+        if not isinstance(next_block, int) or next_block <= current:
+            break
+        current = next_block
+    return total
+
+
+def _is_throttle_error(exc: RuntimeError) -> bool:
+    message = str(exc).lower()
+    return (
+        "429" in message
+        or "too many" in message
+        or "limit" in message
+        or "range" in message
+    )
+
+
+class _RateLimiter:
+    """Enforce minimum spacing between request starts across worker threads."""
+
+    def __init__(self, min_interval_seconds: float) -> None:
+        self._min_interval = max(0.0, min_interval_seconds)
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self) -> None:
+        if self._min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 def _count_swap_logs(
     *,
     rpc_url: str,
@@ -218,76 +490,160 @@ def _count_swap_logs(
     to_block: int,
     chunk_size: int,
     request_sleep_seconds: float,
-) -> int:
-    total = 0
-    current = from_block
+    max_concurrent: int = 5,
+    sample_fraction: float = 1.0,
+    max_onchain_calls: int | None = None,
+    sample_seed: int = 0,
+) -> tuple[int, bool]:
+    """Count (or estimate) Swap logs; returns (count, was_sampled)."""
+    limiter = _RateLimiter(request_sleep_seconds)
+
+    # The address/topic skeleton is constant across the whole run, so each
+    # batch entry is a byte-level substitution instead of a fresh dict dump.
+    entry_template = json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": "__ID__",
+            "method": "eth_getLogs",
+            "params": [
+                {
+                    "fromBlock": "__FROM__",
+                    "toBlock": "__TO__",
+                    "address": pool_id,
+                    "topics": [SWAP_TOPIC0],
+                }
+            ],
+        }
+    ).encode("utf-8")
+
+    def fetch_windows(windows: list[tuple[int, int]]) -> list[list[Any]]:
+        limiter.wait()
+        entries = [
+            entry_template.replace(b'"__ID__"', str(index).encode())
+            .replace(b"__FROM__", hex(window_start).encode())
+            .replace(b"__TO__", hex(window_end).encode())
+            for index, (window_start, window_end) in enumerate(windows)
+        ]
+        return _rpc_post_body(
+            rpc_url,
+            b"[" + b",".join(entries) + b"]",
+            expected_calls=len(windows),
+            methods="eth_getLogs",
+        )
+
+    # Optimistically try the whole range in one call; generous providers
+    # answer it directly and the chunked path is never needed.
+    try:
+        results = fetch_windows([(from_block, to_block)])
+        return len(results[0]), False
+    except RuntimeError as exc:
+        if not _is_throttle_error(exc):
+            raise
+        print(
+            f"[throttle] full-range call rejected, chunking: {exc}",
+            flush=True,
+        )
+
     current_chunk = max(1, chunk_size)
-    total_blocks = (to_block - from_block) + 1
+    windows = []
+    cursor = from_block
+    while cursor <= to_block:
+        end_block = min(cursor + current_chunk - 1, to_block)
+        windows.append((cursor, end_block))
+        cursor = end_block + 1
+
+    # Optionally query only a random subset of windows and scale the count
+    # by block coverage; cheap when a rough coverage ratio is enough.
+    total_range_blocks = (to_block - from_block) + 1
+    target_windows = len(windows)
+    if sample_fraction < 1.0:
+        target_windows = min(
+            target_windows, max(1, math.ceil(len(windows) * sample_fraction))
+        )
+    if max_onchain_calls is not None:
+        target_windows = min(
+            target_windows, max(1, max_onchain_calls * MAX_CALLS_PER_BATCH)
+        )
+    sampled = target_windows < len(windows)
+    if sampled:
+        picked = random.Random(sample_seed).sample(range(len(windows)), target_windows)
+        windows = [windows[index] for index in sorted(picked)]
+
+    batches = [
+        windows[offset : offset + MAX_CALLS_PER_BATCH]
+        for offset in range(0, len(windows), MAX_CALLS_PER_BATCH)
+    ]
+
+    total = 0
+    completed_blocks = 0
+    total_blocks = sum(
+        (window_end - window_start) + 1 for window_start, window_end in windows
+    )
     started = time.monotonic()
     calls = 0
-    while current <= to_block:
-        end_block = min(current + current_chunk - 1, to_block)
-        try:
-            logs = _rpc_call(
-                rpc_url,
-                "eth_getLogs",
-                [
-                    {
-                        "fromBlock": hex(current),
-                        "toBlock": hex(end_block),
-                        "address": pool_id,
-                        "topics": [SWAP_TOPIC0],
-                    }
-                ],
-            )
-            calls += 1
-            total += len(logs)
-            completed_blocks = (end_block - from_block) + 1
-            pct = (completed_blocks / total_blocks) * 100.0
-            elapsed = time.monotonic() - started
-            print(
-                (
-                    "[progress] %.1f%% blocks=%s/%s calls=%s "
-                    "window=%s..%s logs_so_far=%s elapsed=%.1fs"
-                )
-                % (
-                    pct,
-                    completed_blocks,
-                    total_blocks,
-                    calls,
-                    current,
-                    end_block,
-                    total,
-                    elapsed,
-                ),
-                flush=True,
-            )
-            current = end_block + 1
-            if request_sleep_seconds > 0:
-                time.sleep(request_sleep_seconds)
-        except RuntimeError as exc:
-            message = str(exc).lower()
-            if (
-                current_chunk > 1
-                and (
-                    "429" in message
-                    or "too many" in message
-                    or "limit" in message
-                    or "range" in message
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrent)) as pool:
+        pending = {pool.submit(fetch_windows, batch): batch for batch in batches}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                batch = pending.pop(future)
+                try:
+                    results = future.result()
+                except RuntimeError as exc:
+                    if not _is_throttle_error(exc):
+                        raise
+                    # Split the failed work in half and resubmit: first by
+                    # batch, then by block range once down to one window.
+                    if len(batch) > 1:
+                        midpoint = len(batch) // 2
+                        halves = [batch[:midpoint], batch[midpoint:]]
+                    else:
+                        window_start, window_end = batch[0]
+                        if window_start == window_end:
+                            raise
+                        window_mid = (window_start + window_end) // 2
+                        halves = [
+                            [(window_start, window_mid)],
+                            [(window_mid + 1, window_end)],
+                        ]
+                    print(
+                        f"[throttle] splitting failed batch after error: {exc}",
+                        flush=True,
+                    )
+                    for half in halves:
+                        pending[pool.submit(fetch_windows, half)] = half
+                    continue
+
+                calls += 1
+                total += sum(len(logs) for logs in results)
+                completed_blocks += sum(
+                    (window_end - window_start) + 1
+                    for window_start, window_end in batch
                 )
-            ):
+                pct = (completed_blocks / total_blocks) * 100.0
+                elapsed = time.monotonic() - started
                 print(
                     (
-                        "[throttle] reducing chunk size from %s to %s after error: %s"
+                        "[progress] %.1f%% blocks=%s/%s calls=%s "
+                        "window=%s..%s logs_so_far=%s elapsed=%.1fs"
                     )
-                    % (current_chunk, max(1, current_chunk // 2), exc),
+                    % (
+                        pct,
+                        completed_blocks,
+                        total_blocks,
+                        calls,
+                        batch[0][0],
+                        batch[-1][1],
+                        total,
+                        elapsed,
+                    ),
                     flush=True,
                 )
-                current_chunk = max(1, current_chunk // 2)
-                time.sleep(1.0)
-                continue
-            raise
-    return total
+
+    if sampled:
+        return int(round(total * (total_range_blocks / total_blocks))), True
+    return total, False
 
 
 def main() -> int:
@@ -296,11 +652,11 @@ def main() -> int:
 
     try:
         run_log_path = Path(args.run_log) if args.run_log else _latest_run_log()
-        run_log = json.loads(run_log_path.read_text(encoding="utf-8"))
+        run_log = _json_loads(run_log_path.read_bytes())
         if not isinstance(run_log, dict):
             raise ValueError("run log is not a JSON object")
 
-        rpc_url = _resolve_rpc_url(args.rpc_url)
+        rpc_url = None if args.hypersync_url else _resolve_rpc_url(args.rpc_url)
         pool_id = _resolve_pool_id(args.pool_id, args.fee_tier_bps)
 
         uni_key = f"uniswap_{args.fee_tier_bps}bps"
@@ -308,17 +664,36 @@ def main() -> int:
         eth_path = _find_artifact(run_log, "ethereum_rpc")
 
         subgraph_count = _read_record_count(uni_path)
-        from_block, to_block = _read_block_window(eth_path)
-
-        chunk_size = max(1, int(args.chunk_size))
-        onchain_count = _count_swap_logs(
-            rpc_url=rpc_url,
-            pool_id=pool_id,
-            from_block=from_block,
-            to_block=to_block,
-            chunk_size=chunk_size,
-            request_sleep_seconds=max(0.0, args.request_sleep_seconds),
-        )
+        window = _block_window_from_run_log(run_log)
+        if window is None:
+            window = _read_block_window(eth_path)
+        from_block, to_block = window
+
+        if not 0.0 < args.sample_fraction <= 1.0:
+            raise ValueError("--sample-fraction must be in (0, 1]")
+
+        onchain_sampled = False
+        if args.hypersync_url:
+            onchain_count = _count_swap_logs_hypersync(
+                hypersync_url=args.hypersync_url,
+                pool_id=pool_id,
+                from_block=from_block,
+                to_block=to_block,
+            )
+        else:
+            chunk_size = max(1, int(args.chunk_size))
+            onchain_count, onchain_sampled = _count_swap_logs(
+                rpc_url=rpc_url,
+                pool_id=pool_id,
+                from_block=from_block,
+                to_block=to_block,
+                chunk_size=chunk_size,
+                request_sleep_seconds=max(0.0, args.request_sleep_seconds),
+                max_concurrent=max(1, args.max_concurrent),
+                sample_fraction=args.sample_fraction,
+                max_onchain_calls=args.max_onchain_calls,
+                sample_seed=args.sample_seed,
+            )
 
         print(f"run_log: {run_log_path}")
         print(f"fee_tier_bps: {args.fee_tier_bps}")
@@ -327,7 +702,10 @@ def main() -> int:
         print(f"ethereum_artifact: {eth_path}")
         print(f"block_window: {from_block}..{to_block}")
         print(f"subgraph_swap_rows: {subgraph_count}")
-        print(f"onchain_swap_logs: {onchain_count}")
+        if onchain_sampled:
+            print(f"onchain_swap_logs_estimate: {onchain_count}")
+        else:
+            print(f"onchain_swap_logs: {onchain_count}")
 
         if onchain_count == 0:
             print("coverage_ratio_subgraph_vs_chain: n/a (on-chain count is zero)")
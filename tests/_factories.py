@@ -0,0 +1,22 @@
+"""Columnar row factories for pipeline test fixtures."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+
+
+def uniswap_rows(
+    ts: np.ndarray,
+    price: np.ndarray,
+    amount_usd: np.ndarray | None = None,
+) -> list[dict[str, Any]]:
+    """Build raw Graph-style swap rows from columnar arrays."""
+    arrays = [pa.array(ts, type=pa.int64()), pa.array(price)]
+    names = ["timestamp", "token0Price"]
+    if amount_usd is not None:
+        arrays.append(pa.array(amount_usd))
+        names.append("amountUSD")
+    return pa.Table.from_arrays(arrays, names=names).to_pylist()
@@ -0,0 +1,24 @@
+"""Shared JSON fixture helpers for the test suite."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    def write_json(path: Path, obj: Any) -> None:
+        path.write_bytes(orjson.dumps(obj))
+
+    def read_json(path: Path) -> Any:
+        return orjson.loads(path.read_bytes())
+
+except ModuleNotFoundError:  # pragma: no cover - exercised without orjson
+
+    def write_json(path: Path, obj: Any) -> None:
+        path.write_text(json.dumps(obj), encoding="utf-8")
+
+    def read_json(path: Path) -> Any:
+        return json.loads(path.read_bytes())
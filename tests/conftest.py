@@ -1,8 +1,193 @@
 """Test configuration for local package imports."""
 
+import copy
 import sys
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from tests._fixtures import read_json, write_json  # noqa: E402
+
+# Artifact keys written by make_raw_run, in run-log naming.
+_RAW_ARTIFACT_KEYS = (
+    ("uni5", "uniswap_5bps_json"),
+    ("coinbase", "coinbase_json"),
+    ("gas", "ethereum_rpc_json"),
+)
+
+
+@pytest.fixture
+def fake_urlopen(monkeypatch):
+    """Queue-driven urlopen replacement for Coinbase client tests.
+
+    Tests append responses (or callables that raise) to the returned
+    list; each client call consumes the next entry.
+    """
+    queue: list = []
+
+    def _urlopen(*_args, **_kwargs):
+        item = queue.pop(0)
+        return item() if callable(item) else item
+
+    monkeypatch.setattr("ingestion.sources.coinbase.request.urlopen", _urlopen)
+    return queue
+
+
+@pytest.fixture(scope="session")
+def base_raw_payloads():
+    """Baseline raw-run payloads shared by the alignment tests."""
+    return {
+        "start_time_utc": "2025-01-01T00:00:00Z",
+        "end_time_utc": "2025-01-01T00:01:00Z",
+        "uni5": [
+            {"timestamp": 1735689600, "token0Price": "100.0"},
+            {"timestamp": 1735689660, "token0Price": "101.0"},
+        ],
+        "coinbase": [
+            {
+                "timestamp_utc": "2025-01-01T00:00:00Z",
+                "close_price": 100.0,
+                "volume": 12.5,
+            },
+            {
+                "timestamp_utc": "2025-01-01T00:01:00Z",
+                "close_price": 101.0,
+                "volume": 20.0,
+            },
+        ],
+        "gas": [
+            {"timestamp_utc": "2025-01-01T00:00:20Z", "base_fee_per_gas_wei": 20},
+            {"timestamp_utc": "2025-01-01T00:01:10Z", "base_fee_per_gas_wei": 25},
+        ],
+    }
+
+
+@pytest.fixture
+def make_raw_run(base_raw_payloads, tmp_path):
+    """Write a raw-run directory from the baseline plus overrides.
+
+    Overrides replace whole payload entries; setting an artifact key to
+    None omits that artifact from the run log. Returns the run-log path.
+    """
+
+    def _make(**overrides: Any) -> Path:
+        payloads = copy.deepcopy(base_raw_payloads)
+        payloads.update(overrides)
+
+        raw_dir = tmp_path / "raw"
+        raw_dir.mkdir(parents=True, exist_ok=True)
+
+        files: dict[str, str] = {}
+        for payload_key, artifact_key in _RAW_ARTIFACT_KEYS:
+            rows = payloads.get(payload_key)
+            if rows is None:
+                continue
+            path = raw_dir / f"{payload_key}.json"
+            write_json(path, rows)
+            files[artifact_key] = str(path)
+
+        run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
+        write_json(
+            run_log_path,
+            {
+                "start_time_utc": payloads["start_time_utc"],
+                "end_time_utc": payloads["end_time_utc"],
+                "files": files,
+            },
+        )
+        return run_log_path
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Config built once with defaults for assertion-only tests."""
+    from ingestion.config import load_config
+
+    return load_config(
+        start_time_utc="2025-01-01T00:00:00Z",
+        end_time_utc="2025-01-01T00:01:00Z",
+    )
+
+
+@pytest.fixture(scope="session")
+def pq():
+    """Session-cached pyarrow.parquet module for Parquet tests."""
+    import pyarrow.parquet as pq
+
+    return pq
+
+
+@pytest.fixture(scope="session")
+def exported_features(tmp_path_factory):
+    """One canonical export_records run shared by the export tests."""
+    from ingestion.export import export_records
+
+    output_dir = tmp_path_factory.mktemp("export")
+    rows = [
+        {
+            "minute_utc": "2025-01-01T00:00:00Z",
+            "coinbase_close": 100.0,
+            "basis_5_bps": None,
+        },
+        {
+            "minute_utc": "2025-01-01T00:01:00Z",
+            "coinbase_close": None,
+            "basis_5_bps": 8.0,
+        },
+    ]
+    kwargs = {
+        "output_dir": str(output_dir),
+        "dataset_name": "features",
+        "start_time_utc": "2025-01-01T00:00:00Z",
+        "end_time_utc": "2025-01-01T00:01:00Z",
+        "config": {"source": "test"},
+    }
+    result = export_records(rows, **kwargs)
+    payload = read_json(Path(result.metadata_path))
+    return SimpleNamespace(rows=rows, kwargs=kwargs, result=result, payload=payload)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pipelines():
+    """Front-load heavy pipeline imports and the forward-fill kernel.
+
+    With numba installed the kernel compile happens here once per
+    worker instead of inside the first timed test.
+    """
+    import numpy as np
+
+    from ingestion import (  # noqa: F401
+        pipeline_align,
+        pipeline_full,
+        pipeline_processed,
+    )
+
+    pipeline_align._forward_fill_with_age(
+        np.array([0], dtype=np.int64),
+        np.array([np.nan]),
+        np.array([np.nan]),
+        0.5,
+        1.5,
+        10.0,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Zero out retry backoff so no test can accidentally sleep."""
+    no_op = lambda *_args, **_kwargs: None  # noqa: E731
+    monkeypatch.setattr("time.sleep", no_op)
+    for module in (
+        "ingestion.sources.coinbase",
+        "ingestion.sources.ethereum_rpc",
+        "ingestion.sources.uniswap_graph",
+    ):
+        monkeypatch.setattr(f"{module}.time.sleep", no_op, raising=False)
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
-from datetime import UTC, datetime
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import Any
-from unittest.mock import patch
 from urllib import error
 
 import pytest
 
-from ingestion.sources.coinbase import UrllibCoinbaseClient, fetch_coinbase_candles
+from ingestion.sources.coinbase import (
+    MAX_CANDLES_PER_REQUEST,
+    UrllibCoinbaseClient,
+    fetch_coinbase_candles,
+)
 
 
 class _FakeResponse:
@@ -28,15 +32,16 @@ class _FakeResponse:
         return False
 
 
+@dataclass(slots=True)
 class FakeCoinbaseClient:
     """Fake client for fetch_coinbase_candles unit tests."""
 
-    def __init__(self, payload: list[list[float | int]]) -> None:
-        self.payload = payload
-        self.calls: list[tuple[str, dict[str, str]]] = []
+    payload: list[list[float | int]]
+    calls: list[tuple[str, Mapping[str, str]]] = field(default_factory=list)
 
     def get_json(self, path: str, query_params: Mapping[str, str]) -> Any:
-        self.calls.append((path, dict(query_params)))
+        # fetch_coinbase_candles builds a fresh dict per call, so no copy.
+        self.calls.append((path, query_params))
         return self.payload
 
 
@@ -70,13 +75,13 @@ def test_fetch_coinbase_candles_builds_request_and_parses() -> None:
 
 
 def test_fetch_coinbase_candles_chunks_large_windows() -> None:
+    @dataclass(slots=True)
     class ChunkAwareFakeClient:
-        def __init__(self) -> None:
-            self.calls: list[dict[str, str]] = []
+        calls: list[Mapping[str, str]] = field(default_factory=list)
 
         def get_json(self, path: str, query_params: Mapping[str, str]) -> Any:
             del path
-            self.calls.append(dict(query_params))
+            self.calls.append(query_params)
             start = datetime.fromisoformat(
                 query_params["start"].replace("Z", "+00:00")
             ).astimezone(UTC)
@@ -84,12 +89,16 @@ def test_fetch_coinbase_candles_chunks_large_windows() -> None:
             return [[unix_ts, 1, 2, 3, 4, 5]]
 
     client = ChunkAwareFakeClient()
+    # One interval past a single request's capacity: the smallest window
+    # that still forces a second chunk.
+    start = datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
+    end = start + timedelta(seconds=60 * MAX_CANDLES_PER_REQUEST)
     rows = fetch_coinbase_candles(
         client,
         product_id="ETH-USD",
         interval_seconds=60,
-        start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
-        end_time_utc=datetime(2025, 1, 1, 10, 0, tzinfo=UTC),
+        start_time_utc=start,
+        end_time_utc=end,
     )
 
     assert len(client.calls) > 1
@@ -97,38 +106,28 @@ def test_fetch_coinbase_candles_chunks_large_windows() -> None:
     assert rows[0].timestamp_utc < rows[-1].timestamp_utc
 
 
-def test_urllib_coinbase_client_retries_on_429_then_succeeds() -> None:
-    calls = {"count": 0}
+def _raise_http(code: int) -> Any:
+    def _raiser() -> Any:
+        raise _http_error(code)
 
-    def _fake_urlopen(*args: Any, **kwargs: Any) -> _FakeResponse:
-        del args, kwargs
-        calls["count"] += 1
-        if calls["count"] == 1:
-            raise _http_error(429)
-        return _FakeResponse("[]")
+    return _raiser
 
-    client = UrllibCoinbaseClient(max_retries=3, retry_backoff_seconds=0)
 
-    with patch(
-        "ingestion.sources.coinbase.request.urlopen",
-        side_effect=_fake_urlopen,
-    ):
-        payload = client.get_json("products/ETH-USD/candles", {"granularity": "60"})
+def test_urllib_coinbase_client_retries_on_429_then_succeeds(fake_urlopen) -> None:
+    fake_urlopen.extend([_raise_http(429), _FakeResponse("[]")])
+
+    client = UrllibCoinbaseClient(max_retries=3, retry_backoff_seconds=0)
+    payload = client.get_json("products/ETH-USD/candles", {"granularity": "60"})
 
     assert payload == []
-    assert calls["count"] == 2
+    assert not fake_urlopen
 
 
-def test_urllib_coinbase_client_retries_on_5xx_then_fails() -> None:
-    def _fake_urlopen(*args: Any, **kwargs: Any) -> _FakeResponse:
-        del args, kwargs
-        raise _http_error(503)
+def test_urllib_coinbase_client_retries_on_5xx_then_fails(fake_urlopen) -> None:
+    fake_urlopen.extend([_raise_http(503), _raise_http(503)])
 
     client = UrllibCoinbaseClient(max_retries=2, retry_backoff_seconds=0)
+    with pytest.raises(error.HTTPError):
+        client.get_json("products/ETH-USD/candles", {"granularity": "60"})
 
-    with patch(
-        "ingestion.sources.coinbase.request.urlopen",
-        side_effect=_fake_urlopen,
-    ):
-        with pytest.raises(error.HTTPError):
-            client.get_json("products/ETH-USD/candles", {"granularity": "60"})
+    assert not fake_urlopen
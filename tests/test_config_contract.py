@@ -9,11 +9,8 @@ from ingestion.config import load_config
 from ingestion.logging import get_logger
 
 
-def test_config_defaults_and_env_names() -> None:
-    config = load_config(
-        start_time_utc="2025-01-01T00:00:00Z",
-        end_time_utc="2025-01-01T00:01:00Z",
-    )
+def test_config_defaults_and_env_names(default_config) -> None:
+    config = default_config
     assert config.output_dir == "data/processed"
     assert config.uniswap_graph_api_key_env == "UNISWAP_GRAPH_API_KEY"
     assert config.uniswap_graph_subgraph_id_env == "UNISWAP_V3_MAINNET_SUBGRAPH_ID"
@@ -53,6 +50,7 @@ def test_cli_placeholder_command_exits_zero() -> None:
     assert result == 0
 
 
+@pytest.mark.serial
 def test_logger_reuses_single_handler() -> None:
     logger_one = get_logger(name="ingestion.test")
     handler_count = len(logger_one.handlers)
@@ -2,44 +2,101 @@
 
 from __future__ import annotations
 
+import functools
+import json
+import re
+import warnings
 from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
 from ingestion.sources.ethereum_rpc import (
     EthereumRPCError,
+    UrllibEthereumRPCClient,
     fetch_basefee_observations,
     parse_block_basefee,
 )
 
+_MISSING_BLOCK_PATTERN = re.compile("missing block 2")
 
+# Prebuilt fee-history columns, sliced per call instead of rebuilt.
+_PREBUILT_FEES = [hex(100 + i) for i in range(4096)]
+_HALF_RATIOS = [0.5] * 4096
+
+
+@dataclass(slots=True)
 class FakeEthereumRPCClient:
     """Fake Ethereum RPC client with deterministic block responses."""
 
-    def __init__(
-        self, blocks_by_number: Mapping[int, Mapping[str, Any] | None]
-    ) -> None:
-        self.blocks_by_number = dict(blocks_by_number)
-        self._fee_history_calls: list[tuple[int, int]] = []
+    blocks_by_number: dict[int, Mapping[str, Any] | None]
+    _fee_history_calls: list[tuple[int, int]] = field(default_factory=list)
+    _blocks: list[Mapping[str, Any] | None] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # Dense list indexed by block number: lookups skip dict hashing.
+        self._blocks = [None] * (max(self.blocks_by_number) + 1)
+        for number, block in self.blocks_by_number.items():
+            self._blocks[number] = block
 
     def get_latest_block_number(self) -> int:
         return max(self.blocks_by_number)
 
     def get_block_by_number(self, block_number: int) -> Mapping[str, Any] | None:
-        return self.blocks_by_number.get(block_number)
+        if 0 <= block_number < len(self._blocks):
+            return self._blocks[block_number]
+        return None
 
     def get_fee_history(self, block_count: int, newest_block: int) -> Mapping[str, Any]:
         self._fee_history_calls.append((block_count, newest_block))
         oldest_block = newest_block - block_count + 1
         return {
             "oldestBlock": hex(oldest_block),
-            "baseFeePerGas": [hex(100 + i) for i in range(block_count + 1)],
-            "gasUsedRatio": [0.5 for _ in range(block_count)],
+            "baseFeePerGas": _PREBUILT_FEES[: block_count + 1],
+            "gasUsedRatio": _HALF_RATIOS[:block_count],
         }
 
 
+@dataclass(slots=True)
+class FakeBatchingEthereumRPCClient(FakeEthereumRPCClient):
+    """Fake client that answers JSON-RPC batches by dispatching each call."""
+
+    batch_calls: list[list[tuple[str, list[Any]]]] = field(default_factory=list)
+
+    def call_batch(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        self.batch_calls.append(calls)
+        results: list[Any] = []
+        for method, params in calls:
+            if method == "eth_feeHistory":
+                results.append(
+                    self.get_fee_history(int(params[0], 16), int(params[1], 16))
+                )
+            elif method == "eth_getBlockByNumber":
+                results.append(self.get_block_by_number(int(params[0], 16)))
+            else:
+                raise EthereumRPCError(f"unexpected batch method {method}")
+        return results
+
+
+class _FakeResponse:
+    def __init__(self, payload: str) -> None:
+        self._payload = payload
+
+    def read(self) -> bytes:
+        return self._payload.encode("utf-8")
+
+    def __enter__(self) -> "_FakeResponse":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        del exc_type, exc, tb
+        return False
+
+
+@functools.lru_cache(maxsize=None)
 def _make_block(
     block_number: int,
     timestamp_unix: int,
@@ -48,6 +105,7 @@ def _make_block(
     gas_used: int = 200,
     gas_limit: int = 300,
 ) -> dict[str, str]:
+    # Cached: tests treat the returned block dicts as read-only.
     return {
         "number": hex(block_number),
         "timestamp": hex(timestamp_unix),
@@ -85,7 +143,8 @@ def test_fetch_basefee_observations_skips_missing_blocks_with_warning() -> None:
         }
     )
 
-    with pytest.warns(RuntimeWarning, match="missing block 2"):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
         rows = fetch_basefee_observations(
             client,
             start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
@@ -93,6 +152,11 @@ def test_fetch_basefee_observations_skips_missing_blocks_with_warning() -> None:
             rpc_mode="blocks",
         )
 
+    assert any(
+        issubclass(entry.category, RuntimeWarning)
+        and _MISSING_BLOCK_PATTERN.search(str(entry.message))
+        for entry in caught
+    )
     assert [row.block_number for row in rows] == [1, 3, 4]
 
 
@@ -121,6 +185,77 @@ def test_fetch_basefee_observations_feehistory_mode() -> None:
     assert rows[0].gas_used > 0
 
 
+def test_fetch_basefee_observations_feehistory_uses_batching_client() -> None:
+    client = FakeBatchingEthereumRPCClient(
+        {
+            0: _make_block(0, 1735689590, gas_limit=30_000_000),
+            1: _make_block(1, 1735689600, gas_limit=30_000_000),
+            2: _make_block(2, 1735689612, gas_limit=30_000_000),
+            3: _make_block(3, 1735689624, gas_limit=30_000_000),
+        }
+    )
+
+    rows = fetch_basefee_observations(
+        client,
+        start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
+        end_time_utc=datetime(2025, 1, 1, 0, 0, 24, tzinfo=UTC),
+        rpc_mode="feehistory",
+        feehistory_blocks_per_request=2,
+    )
+
+    assert [row.block_number for row in rows] == [1, 2, 3]
+    # One batch per chunk, each bundling feeHistory with its anchor blocks.
+    assert len(client.batch_calls) == 2
+    assert all(calls[0][0] == "eth_feeHistory" for calls in client.batch_calls)
+
+
+def test_fetch_basefee_observations_batch_error_falls_back_sequential() -> None:
+    class _BatchRejectingClient(FakeEthereumRPCClient):
+        def call_batch(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+            # HTTP 200 plus a JSON-RPC error object, as public endpoints
+            # that disable batching respond.
+            raise EthereumRPCError("RPC error: batch requests are not supported")
+
+    client = _BatchRejectingClient(
+        {
+            0: _make_block(0, 1735689590, gas_limit=30_000_000),
+            1: _make_block(1, 1735689600, gas_limit=30_000_000),
+            2: _make_block(2, 1735689612, gas_limit=30_000_000),
+            3: _make_block(3, 1735689624, gas_limit=30_000_000),
+        }
+    )
+
+    rows = fetch_basefee_observations(
+        client,
+        start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
+        end_time_utc=datetime(2025, 1, 1, 0, 0, 24, tzinfo=UTC),
+        rpc_mode="feehistory",
+        feehistory_blocks_per_request=2,
+    )
+
+    assert [row.block_number for row in rows] == [1, 2, 3]
+    assert client._fee_history_calls == [(2, 2), (1, 3)]
+
+
+def test_urllib_call_batch_reorders_out_of_order_ids() -> None:
+    body = json.dumps(
+        [
+            {"jsonrpc": "2.0", "id": 1, "result": "0x2"},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+        ]
+    )
+    urlopen_mock = Mock(return_value=_FakeResponse(body))
+
+    client = UrllibEthereumRPCClient(
+        rpc_url="https://rpc.example", retry_backoff_seconds=0
+    )
+
+    with patch("ingestion.sources.ethereum_rpc.request.urlopen", urlopen_mock):
+        results = client.call_batch([("eth_blockNumber", []), ("eth_chainId", [])])
+
+    assert results == ["0x1", "0x2"]
+
+
 def test_fetch_basefee_observations_auto_falls_back_to_blocks() -> None:
     class _NoFeeHistoryClient(FakeEthereumRPCClient):
         def get_fee_history(
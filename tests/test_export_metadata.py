@@ -2,45 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
-import json
-from datetime import UTC, datetime
 from pathlib import Path
 
 from ingestion.export import export_records
 
 
-def _sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    digest.update(path.read_bytes())
-    return digest.hexdigest()
-
-
-def test_export_records_writes_metadata_fields(tmp_path: Path) -> None:
-    rows = [
-        {
-            "minute_utc": "2025-01-01T00:00:00Z",
-            "coinbase_close": 100.0,
-            "basis_5_bps": None,
-        },
-        {
-            "minute_utc": "2025-01-01T00:01:00Z",
-            "coinbase_close": None,
-            "basis_5_bps": 8.0,
-        },
-    ]
-
-    result = export_records(
-        rows,
-        output_dir=str(tmp_path),
-        dataset_name="features",
-        start_time_utc="2025-01-01T00:00:00Z",
-        end_time_utc="2025-01-01T00:01:00Z",
-        config={"source": "test"},
-    )
-
-    metadata_path = Path(result.metadata_path)
-    payload = json.loads(metadata_path.read_text(encoding="utf-8"))
+def test_export_records_writes_metadata_fields(exported_features) -> None:
+    payload = exported_features.payload
 
     assert payload["dataset_name"] == "features"
     assert payload["row_count"] == 2
@@ -53,21 +21,16 @@ def test_export_records_writes_metadata_fields(tmp_path: Path) -> None:
     assert len(payload["config_hash"]) == 64
 
 
-def test_export_idempotent_for_identical_inputs(tmp_path: Path) -> None:
-    rows = [
-        {"minute_utc": "2025-01-01T00:00:00Z", "coinbase_close": 100.0},
-        {"minute_utc": "2025-01-01T00:01:00Z", "coinbase_close": 101.0},
-    ]
-    kwargs = {
-        "output_dir": str(tmp_path),
-        "dataset_name": "features",
-        "start_time_utc": datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
-        "end_time_utc": datetime(2025, 1, 1, 0, 1, tzinfo=UTC),
-        "config": {"mode": "test"},
-    }
+def test_export_idempotent_for_identical_inputs(exported_features) -> None:
+    """Re-exporting identical inputs rewrites byte-identical artifacts.
 
-    first = export_records(rows, **kwargs)
-    second = export_records(rows, **kwargs)
+    export_records always performs the write (no unchanged-hash short
+    circuit), so idempotency here means same paths and same bytes, not
+    a skipped second write.
+    """
+    # The shared fixture export is call #1; re-export the same inputs.
+    first = exported_features.result
+    second = export_records(exported_features.rows, **exported_features.kwargs)
 
     first_parquet = Path(first.parquet_path)
     second_parquet = Path(second.parquet_path)
@@ -76,5 +39,5 @@ def test_export_idempotent_for_identical_inputs(tmp_path: Path) -> None:
 
     assert first_parquet == second_parquet
     assert first_metadata == second_metadata
-    assert _sha256(first_parquet) == _sha256(second_parquet)
-    assert _sha256(first_metadata) == _sha256(second_metadata)
+    assert first_parquet.read_bytes() == second_parquet.read_bytes()
+    assert first_metadata.read_bytes() == second_metadata.read_bytes()
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 from ingestion.reporting import build_missingness_report, write_missingness_report
+from tests._fixtures import read_json
 
 
 def test_missingness_report_percentages_and_gap_lengths() -> None:
@@ -34,6 +34,6 @@ def test_write_missingness_report_json(tmp_path: Path) -> None:
     output = tmp_path / "missingness.json"
     write_missingness_report(str(output), report)
 
-    loaded = json.loads(output.read_text(encoding="utf-8"))
+    loaded = read_json(output)
     assert loaded["total_rows"] == 1
     assert "coinbase_close" in loaded["per_column"]
@@ -0,0 +1,37 @@
+"""Tests for typed observation records and JSONL serialization."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+from ingestion.models import GasBasefeeObservation, write_observations_jsonl
+
+
+def test_write_observations_jsonl_round_trips_records(tmp_path: Path) -> None:
+    observations = [
+        GasBasefeeObservation(
+            block_number=1,
+            timestamp_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
+            base_fee_per_gas_wei=100,
+            gas_used=200,
+            gas_limit=300,
+        ),
+        GasBasefeeObservation(
+            block_number=2,
+            timestamp_utc=datetime(2025, 1, 1, 0, 1, tzinfo=UTC),
+            base_fee_per_gas_wei=101,
+            gas_used=201,
+            gas_limit=300,
+        ),
+    ]
+
+    output = write_observations_jsonl(tmp_path / "blocks.jsonl", observations)
+
+    lines = Path(output).read_bytes().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert records == [row.to_record() for row in observations]
+    # Timestamps round-trip through the same isoformat as to_record.
+    parsed = datetime.fromisoformat(records[0]["timestamp_utc"])
+    assert parsed == observations[0].timestamp_utc
@@ -2,91 +2,33 @@
 
 from __future__ import annotations
 
-import json
+import copy
 from pathlib import Path
+from typing import Any
 
-from ingestion.pipeline_align import build_aligned_from_raw_run
+import numpy as np
+import pytest
 
+from ingestion.pipeline_align import (
+    build_aligned_from_dicts,
+    build_aligned_from_raw_run,
+)
+from tests._factories import uniswap_rows
+from tests._fixtures import read_json
 
-def test_build_aligned_from_raw_run(tmp_path: Path) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
-
-    coinbase = raw_dir / "coinbase.parquet"
-    coinbase.write_text("", encoding="utf-8")
-
-    # Use JSON artifacts for deterministic test fixtures.
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {
-                    "timestamp": 1735689600,
-                    "token0Price": "100.0",
-                },
-                {
-                    "timestamp": 1735689660,
-                    "token0Price": "101.0",
-                },
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [
-                {
-                    "timestamp_utc": "2025-01-01T00:00:00Z",
-                    "close_price": 100.0,
-                    "volume": 12.5,
-                },
-                {
-                    "timestamp_utc": "2025-01-01T00:01:00Z",
-                    "close_price": 101.0,
-                    "volume": 20.0,
-                },
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    gas_path = raw_dir / "gas.json"
-    gas_path.write_text(
-        json.dumps(
-            [
-                {"timestamp_utc": "2025-01-01T00:00:20Z", "base_fee_per_gas_wei": 20},
-                {"timestamp_utc": "2025-01-01T00:01:10Z", "base_fee_per_gas_wei": 25},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:01:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                    "ethereum_rpc_json": str(gas_path),
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
 
+def _build(tmp_path: Path, run_log_path: Path, **kwargs: Any) -> list[dict[str, Any]]:
     output_path = tmp_path / "interim" / "aligned_records.json"
     written = build_aligned_from_raw_run(
         raw_run_log_path=str(run_log_path),
         output_json_path=str(output_path),
+        **kwargs,
     )
-
     assert written == str(output_path)
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
+    return read_json(output_path)
+
+
+def _check_baseline(rows: list[dict[str, Any]]) -> None:
     assert len(rows) == 2
     assert rows[0]["minute_utc"] == "2025-01-01T00:00:00Z"
     assert rows[0]["coinbase_close"] == 100.0
@@ -98,55 +40,7 @@ def test_build_aligned_from_raw_run(tmp_path: Path) -> None:
     assert rows[0]["uniswap5_flow_usd"] == 0.0
 
 
-def test_build_aligned_forward_fills_uniswap_with_age(tmp_path: Path) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
-
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {"timestamp": 1735689600, "token0Price": "100.0"},
-                {"timestamp": 1735689720, "token0Price": "105.0"},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [
-                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
-                {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 101.0},
-                {"timestamp_utc": "2025-01-01T00:02:00Z", "close_price": 102.0},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:02:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    output_path = tmp_path / "interim" / "aligned_records.json"
-    build_aligned_from_raw_run(
-        raw_run_log_path=str(run_log_path),
-        output_json_path=str(output_path),
-    )
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
-
+def _check_forward_fill_with_age(rows: list[dict[str, Any]]) -> None:
     assert len(rows) == 3
     assert rows[0]["uniswap5_token0_price"] == 100.0
     assert rows[0]["uniswap5_age_since_last_trade_min"] == 0
@@ -156,111 +50,12 @@ def test_build_aligned_forward_fills_uniswap_with_age(tmp_path: Path) -> None:
     assert rows[2]["uniswap5_age_since_last_trade_min"] == 0
 
 
-def test_build_aligned_uses_usd_per_eth_orientation_from_swap_amounts(
-    tmp_path: Path,
-) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
-
-    # Similar shape to USDC/WETH swap amounts from raw Graph swaps.
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {
-                    "timestamp": 1735689600,
-                    "amount0": "-1470.779695",
-                    "amount1": "0.391320430316185363",
-                }
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [{"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 3762.04}]
-        ),
-        encoding="utf-8",
-    )
-
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:00:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    output_path = tmp_path / "interim" / "aligned_records.json"
-    build_aligned_from_raw_run(
-        raw_run_log_path=str(run_log_path),
-        output_json_path=str(output_path),
-    )
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
-
+def _check_usd_per_eth_orientation(rows: list[dict[str, Any]]) -> None:
     assert len(rows) == 1
     assert rows[0]["uniswap5_token0_price"] > 1000.0
 
 
-def test_build_aligned_filters_uniswap_outlier_and_carries_forward(
-    tmp_path: Path,
-) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
-
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {"timestamp": 1735689600, "token0Price": "100.0"},
-                {"timestamp": 1735689660, "token0Price": "10000000.0"},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [
-                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
-                {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 100.0},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:01:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    output_path = tmp_path / "interim" / "aligned_records.json"
-    build_aligned_from_raw_run(
-        raw_run_log_path=str(run_log_path),
-        output_json_path=str(output_path),
-    )
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
-
+def _check_outlier_carry_forward(rows: list[dict[str, Any]]) -> None:
     assert rows[0]["uniswap5_token0_price"] == 100.0
     assert rows[0]["uniswap5_price_outlier_flag"] is False
     assert rows[1]["uniswap5_token0_price"] == 100.0
@@ -268,70 +63,7 @@ def test_build_aligned_filters_uniswap_outlier_and_carries_forward(
     assert rows[1]["uniswap5_price_outlier_flag"] is True
 
 
-def test_build_aligned_aggregates_uniswap_flow_and_swap_count_per_minute(
-    tmp_path: Path,
-) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
-
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {
-                    "timestamp": 1735689601,
-                    "token0Price": "100.0",
-                    "amountUSD": "10.5",
-                },
-                {
-                    "timestamp": 1735689610,
-                    "token0Price": "101.0",
-                    "amountUSD": "5.25",
-                },
-                {
-                    "timestamp": 1735689660,
-                    "token0Price": "102.0",
-                    "amountUSD": "7.0",
-                },
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [
-                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
-                {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 102.0},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:01:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    output_path = tmp_path / "interim" / "aligned_records.json"
-    build_aligned_from_raw_run(
-        raw_run_log_path=str(run_log_path),
-        output_json_path=str(output_path),
-        duplicate_policy="last",
-    )
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
-
+def _check_flow_and_swap_count(rows: list[dict[str, Any]]) -> None:
     assert rows[0]["uniswap5_swap_count"] == 2
     assert rows[0]["uniswap5_flow_usd"] == 15.75
     assert rows[0]["uniswap5_token0_price"] == 101.0
@@ -339,114 +71,168 @@ def test_build_aligned_aggregates_uniswap_flow_and_swap_count_per_minute(
     assert rows[1]["uniswap5_flow_usd"] == 7.0
 
 
-def test_build_aligned_uses_first_duplicate_policy_for_uniswap_minute_price(
-    tmp_path: Path,
-) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
-
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {"timestamp": 1735689601, "token0Price": "100.0", "amountUSD": "1"},
-                {"timestamp": 1735689610, "token0Price": "101.0", "amountUSD": "2"},
-            ]
-        ),
-        encoding="utf-8",
-    )
-
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [{"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0}]
-        ),
-        encoding="utf-8",
-    )
-
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:00:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                },
-            }
-        ),
-        encoding="utf-8",
-    )
-
-    output_path = tmp_path / "interim" / "aligned_records.json"
-    build_aligned_from_raw_run(
-        raw_run_log_path=str(run_log_path),
-        output_json_path=str(output_path),
-        duplicate_policy="first",
-    )
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
-
+def _check_first_duplicate_policy(rows: list[dict[str, Any]]) -> None:
     assert rows[0]["uniswap5_token0_price"] == 100.0
     assert rows[0]["uniswap5_swap_count"] == 2
     assert rows[0]["uniswap5_flow_usd"] == 3.0
 
 
-def test_build_aligned_patches_isolated_uniswap_spike_with_neighbor_mean(
-    tmp_path: Path,
-) -> None:
-    raw_dir = tmp_path / "raw"
-    raw_dir.mkdir(parents=True)
+def _check_spike_patch(rows: list[dict[str, Any]]) -> None:
+    assert rows[0]["uniswap5_token0_price"] == 100.0
+    assert rows[1]["uniswap5_price_spike_patch_flag"] is True
+    assert rows[1]["uniswap5_price_outlier_flag"] is True
+    assert rows[1]["uniswap5_token0_price"] == 100.5
+    assert rows[1]["uniswap5_age_since_last_trade_min"] == 0
+    assert rows[2]["uniswap5_token0_price"] == 101.0
 
-    uni5_path = raw_dir / "uni5.json"
-    uni5_path.write_text(
-        json.dumps(
-            [
-                {"timestamp": 1735689600, "token0Price": "100.0", "amountUSD": "1"},
-                {"timestamp": 1735689660, "token0Price": "125.0", "amountUSD": "1"},
-                {"timestamp": 1735689720, "token0Price": "101.0", "amountUSD": "1"},
-            ]
-        ),
-        encoding="utf-8",
-    )
 
-    coinbase_path = raw_dir / "coinbase.json"
-    coinbase_path.write_text(
-        json.dumps(
-            [
+_CASES = [
+    pytest.param({}, {}, _check_baseline, id="baseline"),
+    pytest.param(
+        {
+            "end_time_utc": "2025-01-01T00:02:00Z",
+            "uni5": [
+                {"timestamp": 1735689600, "token0Price": "100.0"},
+                {"timestamp": 1735689720, "token0Price": "105.0"},
+            ],
+            "coinbase": [
+                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
+                {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 101.0},
+                {"timestamp_utc": "2025-01-01T00:02:00Z", "close_price": 102.0},
+            ],
+            "gas": None,
+        },
+        {},
+        _check_forward_fill_with_age,
+        id="forward_fill_with_age",
+    ),
+    pytest.param(
+        {
+            # Similar shape to USDC/WETH swap amounts from raw Graph swaps.
+            "end_time_utc": "2025-01-01T00:00:00Z",
+            "uni5": [
+                {
+                    "timestamp": 1735689600,
+                    "amount0": "-1470.779695",
+                    "amount1": "0.391320430316185363",
+                }
+            ],
+            "coinbase": [
+                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 3762.04}
+            ],
+            "gas": None,
+        },
+        {},
+        _check_usd_per_eth_orientation,
+        id="usd_per_eth_orientation",
+    ),
+    pytest.param(
+        {
+            "uni5": [
+                {"timestamp": 1735689600, "token0Price": "100.0"},
+                {"timestamp": 1735689660, "token0Price": "10000000.0"},
+            ],
+            "coinbase": [
+                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
+                {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 100.0},
+            ],
+            "gas": None,
+        },
+        {},
+        _check_outlier_carry_forward,
+        id="outlier_carry_forward",
+    ),
+    pytest.param(
+        {
+            "uni5": uniswap_rows(
+                np.array([1735689601, 1735689610, 1735689660]),
+                np.array([100.0, 101.0, 102.0]),
+                np.array([10.5, 5.25, 7.0]),
+            ),
+            "coinbase": [
+                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
+                {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 102.0},
+            ],
+            "gas": None,
+        },
+        {"duplicate_policy": "last"},
+        _check_flow_and_swap_count,
+        id="flow_and_swap_count",
+    ),
+    pytest.param(
+        {
+            "end_time_utc": "2025-01-01T00:00:00Z",
+            "uni5": uniswap_rows(
+                np.array([1735689601, 1735689610]),
+                np.array([100.0, 101.0]),
+                np.array([1.0, 2.0]),
+            ),
+            "coinbase": [
+                {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0}
+            ],
+            "gas": None,
+        },
+        {"duplicate_policy": "first"},
+        _check_first_duplicate_policy,
+        id="first_duplicate_policy",
+    ),
+    pytest.param(
+        {
+            "end_time_utc": "2025-01-01T00:02:00Z",
+            "uni5": uniswap_rows(
+                np.array([1735689600, 1735689660, 1735689720]),
+                np.array([100.0, 125.0, 101.0]),
+                np.array([1.0, 1.0, 1.0]),
+            ),
+            "coinbase": [
                 {"timestamp_utc": "2025-01-01T00:00:00Z", "close_price": 100.0},
                 {"timestamp_utc": "2025-01-01T00:01:00Z", "close_price": 100.5},
                 {"timestamp_utc": "2025-01-01T00:02:00Z", "close_price": 101.0},
-            ]
-        ),
-        encoding="utf-8",
-    )
+            ],
+            "gas": None,
+        },
+        {},
+        _check_spike_patch,
+        id="spike_patch",
+    ),
+]
+
+
+# Payload keys in base_raw_payloads mapped to run-log artifact prefixes.
+_ARTIFACT_KEYS = (
+    ("uni5", "uniswap_5bps"),
+    ("coinbase", "coinbase"),
+    ("gas", "ethereum_rpc"),
+)
+
+
+@pytest.mark.parametrize(("overrides", "build_kwargs", "check"), _CASES)
+def test_build_aligned(
+    base_raw_payloads,
+    overrides: dict[str, Any],
+    build_kwargs: dict[str, Any],
+    check: Any,
+) -> None:
+    payloads = copy.deepcopy(base_raw_payloads)
+    payloads.update(overrides)
+    artifacts = {
+        artifact_key: payloads[payload_key]
+        for payload_key, artifact_key in _ARTIFACT_KEYS
+        if payloads.get(payload_key) is not None
+    }
 
-    run_log_path = raw_dir / "raw_ingestion_run_20250101T000000Z.json"
-    run_log_path.write_text(
-        json.dumps(
-            {
-                "start_time_utc": "2025-01-01T00:00:00Z",
-                "end_time_utc": "2025-01-01T00:02:00Z",
-                "files": {
-                    "uniswap_5bps_json": str(uni5_path),
-                    "coinbase_json": str(coinbase_path),
-                },
-            }
-        ),
-        encoding="utf-8",
+    rows = build_aligned_from_dicts(
+        artifacts,
+        start_time_utc=payloads["start_time_utc"],
+        end_time_utc=payloads["end_time_utc"],
+        **build_kwargs,
     )
+    check(rows)
 
-    output_path = tmp_path / "interim" / "aligned_records.json"
-    build_aligned_from_raw_run(
-        raw_run_log_path=str(run_log_path),
-        output_json_path=str(output_path),
-    )
-    rows = json.loads(output_path.read_text(encoding="utf-8"))
 
-    assert rows[0]["uniswap5_token0_price"] == 100.0
-    assert rows[1]["uniswap5_price_spike_patch_flag"] is True
-    assert rows[1]["uniswap5_price_outlier_flag"] is True
-    assert rows[1]["uniswap5_token0_price"] == 100.5
-    assert rows[1]["uniswap5_age_since_last_trade_min"] == 0
-    assert rows[2]["uniswap5_token0_price"] == 101.0
+def test_build_aligned_from_raw_run_reads_and_writes_files(
+    make_raw_run, tmp_path: Path
+) -> None:
+    # Integration path: run-log discovery, artifact loading, JSON output.
+    rows = _build(tmp_path, make_raw_run())
+    _check_baseline(rows)
@@ -2,26 +2,29 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from types import SimpleNamespace
+from typing import NamedTuple
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
+from ingestion import pipeline_full
+from ingestion.pipeline_align import AlignedFrame
 from ingestion.pipeline_full import evaluate_alignment_quality, run_full_pipeline
 from ingestion.validation import ValidationError
+from tests._fixtures import read_json, write_json
 
 
-@dataclass(frozen=True)
-class _FakeRawResult:
+class _FakeRawResult(NamedTuple):
     run_id: str
     files: dict[str, str]
     row_counts: dict[str, int]
 
 
-@dataclass(frozen=True)
-class _FakeProcessedResult:
+class _FakeProcessedResult(NamedTuple):
     dataset_json_path: str
     report_json_path: str
     parquet_path: str
@@ -29,6 +32,68 @@ class _FakeProcessedResult:
     validation_issue_count: int
 
 
+@pytest.fixture(scope="module")
+def fake_artifacts(tmp_path_factory):
+    """Stub pipeline artifacts written once and shared by both tests."""
+    artifact_dir = tmp_path_factory.mktemp("full_pipeline")
+
+    run_log = artifact_dir / "raw_ingestion_run_fake.json"
+    run_log.write_text("{}", encoding="utf-8")
+
+    # Columnar aligned fixture: exercises the parquet branch of the
+    # aligned-records reader without any JSON decode.
+    aligned_full = artifact_dir / "aligned_full.parquet"
+    pq.write_table(
+        pa.Table.from_pylist(
+            [
+                {
+                    "minute_utc": "2025-01-01T00:00:00Z",
+                    "coinbase_close": 100.0,
+                    "uniswap5_token0_price": 100.1,
+                    "uniswap30_token0_price": 100.2,
+                    "uniswap5_age_since_last_trade_min": 0,
+                    "uniswap30_age_since_last_trade_min": 0,
+                }
+            ]
+        ),
+        aligned_full,
+    )
+
+    aligned_minimal = artifact_dir / "aligned_minimal.json"
+    write_json(aligned_minimal, [{"minute_utc": "2025-01-01T00:00:00Z"}])
+
+    dataset_path = artifact_dir / "dataset.json"
+    write_json(
+        dataset_path,
+        [
+            {
+                "minute_utc": "2025-01-01T00:00:00Z",
+                "coinbase_close": 100.0,
+                "uniswap5_token0_price": 100.1,
+                "uniswap30_token0_price": 100.2,
+                "realized_vol_annualized": None,
+            }
+        ],
+    )
+
+    report_path = artifact_dir / "report.json"
+    report_path.write_text("{}", encoding="utf-8")
+    parquet_path = artifact_dir / "features.parquet"
+    parquet_path.write_text("", encoding="utf-8")
+    metadata_path = artifact_dir / "features.metadata.json"
+    metadata_path.write_text("{}", encoding="utf-8")
+
+    return SimpleNamespace(
+        run_log=run_log,
+        aligned_full=aligned_full,
+        aligned_minimal=aligned_minimal,
+        dataset_path=dataset_path,
+        report_path=report_path,
+        parquet_path=parquet_path,
+        metadata_path=metadata_path,
+    )
+
+
 def test_evaluate_alignment_quality_flags_coverage_and_staleness() -> None:
     rows = [
         {
@@ -62,69 +127,44 @@ def test_evaluate_alignment_quality_flags_coverage_and_staleness() -> None:
     assert "low_uniswap30_coverage" in codes
     assert "high_uniswap5_staleness" in codes
 
-
-def test_run_full_pipeline_writes_summary(monkeypatch, tmp_path: Path) -> None:
-    run_log = tmp_path / "raw_ingestion_run_fake.json"
-    run_log.write_text("{}", encoding="utf-8")
-
-    aligned_path = tmp_path / "aligned.json"
-    aligned_path.write_text(
-        json.dumps(
-            [
-                {
-                    "minute_utc": "2025-01-01T00:00:00Z",
-                    "coinbase_close": 100.0,
-                    "uniswap5_token0_price": 100.1,
-                    "uniswap30_token0_price": 100.2,
-                    "uniswap5_age_since_last_trade_min": 0,
-                    "uniswap30_age_since_last_trade_min": 0,
-                }
-            ]
-        ),
-        encoding="utf-8",
+    # The columnar AlignedFrame path must agree with the record path.
+    frame_metrics, frame_issues = evaluate_alignment_quality(
+        AlignedFrame.from_records(rows),
+        min_uniswap5_coverage=1.0,
+        min_uniswap30_coverage=0.5,
+        staleness_threshold_minutes=60,
+        max_uniswap5_stale_share=0.2,
+        max_uniswap30_stale_share=1.0,
     )
+    assert frame_metrics == metrics
+    assert frame_issues == issues
 
-    dataset_path = tmp_path / "dataset.json"
-    dataset_path.write_text(
-        json.dumps(
-            [
-                {
-                    "minute_utc": "2025-01-01T00:00:00Z",
-                    "coinbase_close": 100.0,
-                    "uniswap5_token0_price": 100.1,
-                    "uniswap30_token0_price": 100.2,
-                    "realized_vol_annualized": None,
-                }
-            ]
-        ),
-        encoding="utf-8",
-    )
-    report_path = tmp_path / "report.json"
-    report_path.write_text("{}", encoding="utf-8")
-    parquet_path = tmp_path / "features.parquet"
-    parquet_path.write_text("", encoding="utf-8")
-    metadata_path = tmp_path / "features.metadata.json"
-    metadata_path.write_text("{}", encoding="utf-8")
 
+def test_run_full_pipeline_writes_summary(
+    monkeypatch, fake_artifacts, tmp_path: Path
+) -> None:
     monkeypatch.setattr(
-        "ingestion.pipeline_full.run_raw_ingestion",
+        pipeline_full,
+        "run_raw_ingestion",
         lambda **kwargs: _FakeRawResult(
             run_id="fake_run",
-            files={"run_log": str(run_log)},
+            files={"run_log": str(fake_artifacts.run_log)},
             row_counts={"coinbase": 1},
         ),
     )
     monkeypatch.setattr(
-        "ingestion.pipeline_full.build_aligned_from_raw_run",
-        lambda **kwargs: str(aligned_path),
+        pipeline_full,
+        "build_aligned_from_raw_run",
+        lambda **kwargs: str(fake_artifacts.aligned_full),
     )
     monkeypatch.setattr(
-        "ingestion.pipeline_full.run_processed_pipeline",
+        pipeline_full,
+        "run_processed_pipeline",
         lambda *args, **kwargs: _FakeProcessedResult(
-            dataset_json_path=str(dataset_path),
-            report_json_path=str(report_path),
-            parquet_path=str(parquet_path),
-            metadata_path=str(metadata_path),
+            dataset_json_path=str(fake_artifacts.dataset_path),
+            report_json_path=str(fake_artifacts.report_path),
+            parquet_path=str(fake_artifacts.parquet_path),
+            metadata_path=str(fake_artifacts.metadata_path),
             validation_issue_count=0,
         ),
     )
@@ -137,32 +177,26 @@ def test_run_full_pipeline_writes_summary(monkeypatch, tmp_path: Path) -> None:
 
     summary_path = Path(result.summary_json_path)
     assert summary_path.exists()
-    summary = json.loads(summary_path.read_text(encoding="utf-8"))
+    summary = read_json(summary_path)
     assert summary["raw_run_id"] == "fake_run"
     assert summary["dataset_summary"]["row_count"] == 1
-    assert summary["artifacts"]["dataset_json"] == str(dataset_path)
-
+    assert summary["artifacts"]["dataset_json"] == str(fake_artifacts.dataset_path)
 
-def test_run_full_pipeline_quality_gate_fail(monkeypatch, tmp_path: Path) -> None:
-    run_log = tmp_path / "raw_ingestion_run_fake.json"
-    run_log.write_text("{}", encoding="utf-8")
-
-    aligned_path = tmp_path / "aligned.json"
-    aligned_path.write_text(
-        json.dumps([{"minute_utc": "2025-01-01T00:00:00Z"}]), encoding="utf-8"
-    )
 
+def test_run_full_pipeline_quality_gate_fail(monkeypatch, fake_artifacts) -> None:
     monkeypatch.setattr(
-        "ingestion.pipeline_full.run_raw_ingestion",
+        pipeline_full,
+        "run_raw_ingestion",
         lambda **kwargs: _FakeRawResult(
             run_id="fake_run",
-            files={"run_log": str(run_log)},
+            files={"run_log": str(fake_artifacts.run_log)},
             row_counts={},
         ),
     )
     monkeypatch.setattr(
-        "ingestion.pipeline_full.build_aligned_from_raw_run",
-        lambda **kwargs: str(aligned_path),
+        pipeline_full,
+        "build_aligned_from_raw_run",
+        lambda **kwargs: str(fake_artifacts.aligned_minimal),
     )
 
     with pytest.raises(ValidationError):
@@ -2,17 +2,53 @@
 
 from __future__ import annotations
 
-import json
 import math
+import mmap
+import struct
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
+import numpy as np
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
+from ingestion.dataset_builder import build_dataset_rows
 from ingestion.pipeline_processed import ValidationError, run_processed_pipeline
+from tests._fixtures import read_json
 
+try:
+    import msgspec
+except ModuleNotFoundError:  # pragma: no cover - exercised without msgspec
+    msgspec = None
 
-def _aligned_rows() -> list[dict[str, object]]:
-    return [
+
+def _read_frames(path: Path) -> list[dict[str, object]]:
+    """Walk length-prefixed msgpack frames over an mmap of the file."""
+    rows: list[dict[str, object]] = []
+    with path.open("rb") as fh, mmap.mmap(
+        fh.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buf:
+        offset = 0
+        while offset < len(buf):
+            (length,) = struct.unpack_from(">I", buf, offset)
+            offset += 4
+            rows.append(msgspec.msgpack.decode(buf[offset : offset + length]))
+            offset += length
+    return rows
+
+
+# Expected values derived from the fixture rows, computed once at import.
+_LOG_100 = math.log(100.0)
+_LOG_101_OVER_100 = math.log(101.0 / 100.0)
+_LOG_101_1_OVER_100_1 = math.log(101.1 / 100.1)
+_WEDGE5_BPS = 10_000.0 * (math.log(100.1) - _LOG_100)
+
+# Built once; read-only proxies keep tests from mutating shared rows.
+_ALIGNED_ROWS = tuple(
+    MappingProxyType(row)
+    for row in (
         {
             "minute_utc": "2025-01-01T00:00:00Z",
             "coinbase_close": 100.0,
@@ -27,50 +63,148 @@ def _aligned_rows() -> list[dict[str, object]]:
             "uniswap30_token0_price": 100.9,
             "gas_base_fee_per_gas_wei": 20_000_000_000,
         },
-    ]
+    )
+)
+
+
+def _aligned_rows() -> tuple[Mapping[str, object], ...]:
+    return _ALIGNED_ROWS
+
+
+@pytest.fixture(scope="module")
+def processed_result(tmp_path_factory):
+    """One pipeline run shared by all artifact/value assertions."""
+    return run_processed_pipeline(
+        _aligned_rows(),
+        output_dir=str(tmp_path_factory.mktemp("processed")),
+        dataset_name="aligned_dataset",
+        realized_vol_window=1,
+        annualization_minutes=1,
+        fail_on_warnings=False,
+        emit_json=False,
+    )
+
+
+@pytest.fixture(scope="module")
+def processed_rows(processed_result, pq):
+    return pq.read_table(processed_result.parquet_path).to_pylist()
+
+
+@pytest.mark.slow
+def test_run_processed_pipeline_writes_artifacts(
+    processed_result, processed_rows
+) -> None:
+    assert processed_result.dataset_json_path is None
+    assert Path(processed_result.report_json_path).exists()
+    assert Path(processed_result.parquet_path).exists()
+    assert Path(processed_result.metadata_path).exists()
+
+    assert "realized_vol_annualized" in processed_rows[0]
+    assert processed_rows[0]["coinbase_log_return"] is None
+
+    report = read_json(Path(processed_result.report_json_path))
+    assert "validation_issues" in report
+
+
+@pytest.mark.parametrize(
+    ("row", "key", "expected"),
+    [
+        (0, "uniswap5_fee_tier_bps", 5),
+        (0, "uniswap30_fee_tier_bps", 30),
+    ],
+)
+def test_processed_dataset_values(processed_rows, row, key, expected) -> None:
+    assert processed_rows[row][key] == expected
+
+
+# (row, key, expected) float expectations checked in one vectorized pass.
+_FLOAT_EXPECTATIONS = (
+    (0, "coinbase_log_price", _LOG_100),
+    (0, "wedge_5_price_diff", 0.1),
+    (0, "gas_base_fee_gwei", 20.0),
+    (0, "gas_usd", 0.4),
+    (0, "congestion_30d_pct", 1.0),
+    (0, "wedge_5_bps", _WEDGE5_BPS),
+    (1, "coinbase_log_return", _LOG_101_OVER_100),
+    (1, "uniswap5_log_return", _LOG_101_1_OVER_100_1),
+    (1, "gas_usd", 0.404),
+    (1, "congestion_30d_pct", 1.0),
+)
 
 
-def test_run_processed_pipeline_writes_artifacts(tmp_path: Path) -> None:
+def test_processed_dataset_float_values(processed_rows) -> None:
+    actual = np.array(
+        [processed_rows[row][key] for row, key, _ in _FLOAT_EXPECTATIONS]
+    )
+    expected = np.array([value for _, _, value in _FLOAT_EXPECTATIONS])
+    # Same tolerance as the pytest.approx default these replaced.
+    np.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(msgspec is None, reason="msgspec not installed")
+def test_run_processed_pipeline_msgpack_dataset(tmp_path: Path) -> None:
     result = run_processed_pipeline(
         _aligned_rows(),
         output_dir=str(tmp_path),
         dataset_name="aligned_dataset",
         realized_vol_window=1,
         annualization_minutes=1,
-        fail_on_warnings=False,
+        dataset_format="msgpack",
     )
 
-    assert Path(result.dataset_json_path).exists()
-    assert Path(result.report_json_path).exists()
-    assert Path(result.parquet_path).exists()
-    assert Path(result.metadata_path).exists()
+    dataset_path = Path(result.dataset_json_path)
+    assert dataset_path.suffix == ".mp"
 
-    rows = json.loads(Path(result.dataset_json_path).read_text(encoding="utf-8"))
+    rows = _read_frames(dataset_path)
+    assert len(rows) == 2
     assert rows[0]["uniswap5_fee_tier_bps"] == 5
-    assert rows[0]["uniswap30_fee_tier_bps"] == 30
-    assert "realized_vol_annualized" in rows[0]
-    assert rows[0]["coinbase_log_return"] is None
-    assert rows[0]["coinbase_log_price"] == pytest.approx(math.log(100.0))
-    assert rows[0]["wedge_5_price_diff"] == pytest.approx(0.1)
-    assert rows[0]["gas_base_fee_gwei"] == pytest.approx(20.0)
-    assert rows[0]["gas_usd"] == pytest.approx(0.4)
-    assert rows[0]["congestion_30d_pct"] == pytest.approx(1.0)
-    assert rows[0]["wedge_5_bps"] == pytest.approx(
-        10_000.0 * (math.log(100.1) - math.log(100.0))
+    assert rows[1]["coinbase_log_return"] == pytest.approx(_LOG_101_OVER_100)
+
+
+@st.composite
+def _aligned_rows_strategy(draw) -> list[dict[str, object]]:
+    """Generated aligned rows: monotone minutes, positive prices."""
+    count = draw(st.integers(min_value=2, max_value=8))
+    closes = draw(
+        st.lists(
+            st.floats(min_value=50.0, max_value=200.0),
+            min_size=count,
+            max_size=count,
+        )
     )
-    assert rows[1]["coinbase_log_return"] == pytest.approx(math.log(101.0 / 100.0))
-    assert rows[1]["uniswap5_log_return"] == pytest.approx(math.log(101.1 / 100.1))
-    assert rows[1]["gas_usd"] == pytest.approx(0.404)
-    assert rows[1]["congestion_30d_pct"] == pytest.approx(1.0)
+    return [
+        {
+            "minute_utc": f"2025-01-01T00:{idx:02d}:00Z",
+            "coinbase_close": close,
+            "uniswap5_token0_price": close,
+            "gas_base_fee_per_gas_wei": 20_000_000_000 + idx,
+        }
+        for idx, close in enumerate(closes)
+    ]
 
-    report = json.loads(Path(result.report_json_path).read_text(encoding="utf-8"))
-    assert "validation_issues" in report
+
+@given(rows=_aligned_rows_strategy())
+@settings(max_examples=10, deadline=None)
+def test_dataset_rows_invariants(rows: list[dict[str, object]]) -> None:
+    dataset = build_dataset_rows(rows, realized_vol_window=1, annualization_minutes=1)
+
+    assert len(dataset) == len(rows)
+    closes = np.array([row["coinbase_close"] for row in rows], dtype=np.float64)
+    wei = np.array(
+        [row["gas_base_fee_per_gas_wei"] for row in rows], dtype=np.float64
+    )
+    np.testing.assert_allclose(
+        np.array([row["gas_base_fee_gwei"] for row in dataset]), wei / 1e9
+    )
+    np.testing.assert_allclose(
+        np.array([row["coinbase_log_price"] for row in dataset]), np.log(closes)
+    )
 
 
 def test_run_processed_pipeline_respects_fail_on_warnings(tmp_path: Path) -> None:
-    rows = _aligned_rows()
-    rows[0]["coinbase_close"] = None
-    rows[1]["coinbase_close"] = None
+    # Shallow-copy only here, where the rows need mutating.
+    rows = [dict(row) | {"coinbase_close": None} for row in _aligned_rows()]
 
     with pytest.raises(ValidationError):
         run_processed_pipeline(
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
+import pyarrow as pa
 import pyarrow.parquet as pq
+import pytest
 
 from ingestion import pipeline_raw
+from ingestion.pipeline_raw import InMemorySink
 
 
 class _FakeGraphClient:
@@ -28,100 +32,68 @@ class _FakeRPCClient:
         self.rpc_url = rpc_url
 
 
-def test_run_raw_ingestion_parquet_only(monkeypatch, tmp_path: Path) -> None:
-    monkeypatch.setattr(
-        pipeline_raw,
-        "resolve_graph_endpoint",
-        lambda **kwargs: "https://graph.example",
-    )
-    monkeypatch.setattr(pipeline_raw, "UrllibGraphClient", _FakeGraphClient)
-    monkeypatch.setattr(
-        pipeline_raw,
-        "fetch_pool_swaps_raw",
-        lambda *args, **kwargs: [{"id": "1", "amountUSD": "10.0"}],
-    )
+@dataclass(slots=True, frozen=True)
+class _FakeCoinbaseObs:
+    def to_record(self) -> dict[str, object]:
+        return {"minute_utc": "2025-01-01T00:00:00Z", "close": 1.0}
 
-    monkeypatch.setattr(pipeline_raw, "UrllibCoinbaseClient", _FakeCoinbaseClient)
-    monkeypatch.setattr(
-        pipeline_raw,
-        "fetch_coinbase_candles",
-        lambda *args, **kwargs: [
-            type(
-                "CoinbaseObs",
-                (),
-                {
-                    "to_record": lambda self: {
-                        "minute_utc": "2025-01-01T00:00:00Z",
-                        "close": 1.0,
-                    }
-                },
-            )()
-        ],
-    )
-    monkeypatch.setattr(
-        pipeline_raw,
-        "coinbase_observations_to_records",
-        lambda rows: [row.to_record() for row in rows],
-    )
 
-    monkeypatch.setattr(pipeline_raw, "UrllibEthereumRPCClient", _FakeRPCClient)
-    monkeypatch.setattr(
-        pipeline_raw,
-        "fetch_basefee_observations",
-        lambda *args, **kwargs: [
-            type(
-                "EthObs",
-                (),
-                {"to_record": lambda self: {"block_number": 1, "base_fee": 100}},
-            )()
-        ],
-    )
-    monkeypatch.setattr(
-        pipeline_raw,
-        "ethereum_observations_to_records",
-        lambda rows: [row.to_record() for row in rows],
-    )
+@dataclass(slots=True, frozen=True)
+class _FakeEthObs:
+    def to_record(self) -> dict[str, object]:
+        return {"block_number": 1, "base_fee": 100}
+
+
+# Every pipeline_raw stub the format tests need, applied in one place.
+_RAW_PATCHES = {
+    "resolve_graph_endpoint": lambda **kwargs: "https://graph.example",
+    "UrllibGraphClient": _FakeGraphClient,
+    "fetch_pool_swaps_raw": lambda *args, **kwargs: [{"id": "1", "amountUSD": "10.0"}],
+    "UrllibCoinbaseClient": _FakeCoinbaseClient,
+    "fetch_coinbase_candles": lambda *args, **kwargs: [_FakeCoinbaseObs()],
+    "coinbase_observations_to_records": lambda rows: [row.to_record() for row in rows],
+    "UrllibEthereumRPCClient": _FakeRPCClient,
+    "fetch_basefee_observations": lambda *args, **kwargs: [_FakeEthObs()],
+    "ethereum_observations_to_records": lambda rows: [row.to_record() for row in rows],
+}
+
+
+@pytest.fixture
+def patched_raw(monkeypatch):
+    """Stub every pipeline_raw collaborator for the format tests."""
+    for name, value in _RAW_PATCHES.items():
+        monkeypatch.setattr(pipeline_raw, name, value)
+
 
+@pytest.mark.parametrize("raw_format", ["parquet", "feather"])
+def test_run_raw_ingestion_single_binary_format(patched_raw, raw_format: str) -> None:
+    sink = InMemorySink()
     result = pipeline_raw.run_raw_ingestion(
         start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
         end_time_utc=datetime(2025, 1, 1, 0, 10, tzinfo=UTC),
-        output_dir=str(tmp_path),
         graph_endpoint="https://graph.example",
         uniswap_pool_5_bps="0xpool5",
         uniswap_pool_30_bps="0xpool30",
         rpc_url="https://rpc.example",
-        raw_format="parquet",
+        raw_format=raw_format,
+        artifact_sink=sink,
     )
 
-    assert "uniswap_5bps_parquet" in result.files
+    assert f"uniswap_5bps_{raw_format}" in result.files
     assert "uniswap_5bps_json" not in result.files
-    assert "coinbase_parquet" in result.files
-    assert "ethereum_rpc_parquet" in result.files
-    parquet_path = Path(result.files["coinbase_parquet"])
-    assert parquet_path.exists()
-    assert pq.read_table(parquet_path).num_rows == 1
-
-
-def test_run_raw_ingestion_both_formats(monkeypatch, tmp_path: Path) -> None:
-    monkeypatch.setattr(
-        pipeline_raw,
-        "resolve_graph_endpoint",
-        lambda **kwargs: "https://graph.example",
-    )
-    monkeypatch.setattr(pipeline_raw, "UrllibGraphClient", _FakeGraphClient)
-    monkeypatch.setattr(
-        pipeline_raw,
-        "fetch_pool_swaps_raw",
-        lambda *args, **kwargs: [{"id": "1", "amountUSD": "10.0"}],
-    )
-    monkeypatch.setattr(pipeline_raw, "UrllibCoinbaseClient", _FakeCoinbaseClient)
-    monkeypatch.setattr(
-        pipeline_raw, "fetch_coinbase_candles", lambda *args, **kwargs: []
-    )
-    monkeypatch.setattr(
-        pipeline_raw, "coinbase_observations_to_records", lambda rows: []
-    )
-
+    assert f"coinbase_{raw_format}" in result.files
+    assert f"ethereum_rpc_{raw_format}" in result.files
+    coinbase_buffer = sink.buffers[Path(result.files[f"coinbase_{raw_format}"]).name]
+    reader = pa.BufferReader(coinbase_buffer.getvalue())
+    if raw_format == "parquet":
+        # Row count lives in the footer; no need to decode any column.
+        assert pq.read_metadata(reader).num_rows == 1
+    else:
+        assert pa.ipc.open_file(reader).get_batch(0).num_rows == 1
+
+
+@pytest.mark.slow
+def test_run_raw_ingestion_both_formats(patched_raw, tmp_path: Path) -> None:
     result = pipeline_raw.run_raw_ingestion(
         start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
         end_time_utc=datetime(2025, 1, 1, 0, 10, tzinfo=UTC),
@@ -39,7 +39,9 @@ def test_normalize_timestamp_to_minute_handles_naive_datetime() -> None:
     assert normalize_timestamp_to_minute(ts) == datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
 
 
-def test_align_records_duplicate_policy_last_and_first() -> None:
+@pytest.fixture(scope="module")
+def duplicate_policy_inputs():
+    """Minute index and duplicate-bearing records built once per module."""
     minute_index = build_minute_index(
         datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
         datetime(2025, 1, 1, 0, 1, tzinfo=UTC),
@@ -49,22 +51,25 @@ def test_align_records_duplicate_policy_last_and_first() -> None:
         {"timestamp_utc": "2025-01-01T00:00:20Z", "price": 101.0},
         {"timestamp_utc": "2025-01-01T00:01:10Z", "price": 102.0},
     ]
+    return minute_index, records
 
-    last_map = align_records_to_minute_index(
-        minute_index,
-        records,
-        timestamp_key="timestamp_utc",
-        duplicate_policy="last",
-    )
-    first_map = align_records_to_minute_index(
+
+@pytest.mark.parametrize(
+    ("policy", "expected_price"), [("last", 101.0), ("first", 100.0)]
+)
+def test_align_records_duplicate_policy(
+    duplicate_policy_inputs, policy: str, expected_price: float
+) -> None:
+    minute_index, records = duplicate_policy_inputs
+
+    aligned = align_records_to_minute_index(
         minute_index,
         records,
         timestamp_key="timestamp_utc",
-        duplicate_policy="first",
+        duplicate_policy=policy,
     )
 
-    assert last_map[datetime(2025, 1, 1, 0, 0, tzinfo=UTC)]["price"] == 101.0
-    assert first_map[datetime(2025, 1, 1, 0, 0, tzinfo=UTC)]["price"] == 100.0
+    assert aligned[datetime(2025, 1, 1, 0, 0, tzinfo=UTC)]["price"] == expected_price
 
 
 def test_align_records_rejects_bad_duplicate_policy() -> None:
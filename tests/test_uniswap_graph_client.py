@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import array
 from collections.abc import Mapping
 from datetime import UTC, datetime
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 from urllib import error
 
+import msgspec
 import pytest
 
 from ingestion.sources.uniswap_graph import (
@@ -15,23 +17,38 @@ from ingestion.sources.uniswap_graph import (
     MAINNET_NETWORK_LABEL,
     UrllibGraphClient,
     fetch_pool_minutes,
+    fetch_pool_swaps_raw,
     fetch_two_fee_tiers,
     resolve_graph_endpoint,
 )
 
 
+class _PageEnvelope(msgspec.Struct):
+    """Graph response envelope prebuilt once per page."""
+
+    data: dict[str, list[dict[str, Any]]]
+
+
+_EMPTY_ENVELOPE = _PageEnvelope(data={"poolMinuteDatas": []})
+
+
 class FakeGraphClient:
     """Simple fake Graph client with deterministic paged responses."""
 
-    def __init__(self, pages_by_skip: Mapping[int, list[dict[str, Any]]]) -> None:
-        self.pages_by_skip = dict(pages_by_skip)
-        self.calls: list[dict[str, Any]] = []
+    def __init__(self, pages_by_cursor: Mapping[int, list[dict[str, Any]]]) -> None:
+        # Envelopes are assembled once here; post_json only looks up.
+        self._envelopes = {
+            cursor: _PageEnvelope(data={"poolMinuteDatas": page})
+            for cursor, page in pages_by_cursor.items()
+        }
+        # Compact int64 cursor ledger instead of copying variables per call.
+        self.after_ts_calls = array.array("q")
 
     def post_json(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
         del query
-        self.calls.append(dict(variables))
-        skip = int(variables["skip"])
-        return {"data": {"poolMinuteDatas": self.pages_by_skip.get(skip, [])}}
+        after_ts = int(variables["afterTs"])
+        self.after_ts_calls.append(after_ts)
+        return msgspec.to_builtins(self._envelopes.get(after_ts, _EMPTY_ENVELOPE))
 
 
 class _FakeResponse:
@@ -60,10 +77,12 @@ def _row(unix_ts: int, token0_price: str = "1.0") -> dict[str, str | int]:
 
 
 def test_fetch_pool_minutes_paginates_and_stops_on_empty_page() -> None:
+    # Pages mirror the Graph contract: rows ordered by periodStartUnix asc,
+    # keyed by the timestamp cursor sent as afterTs.
     client = FakeGraphClient(
         {
-            0: [_row(1735689720), _row(1735689660)],
-            2: [_row(1735689780), _row(1735689840)],
+            1735689599: [_row(1735689660), _row(1735689720)],
+            1735689720: [_row(1735689780), _row(1735689840)],
         }
     )
 
@@ -78,14 +97,76 @@ def test_fetch_pool_minutes_paginates_and_stops_on_empty_page() -> None:
 
     assert [r.timestamp_utc for r in rows] == sorted(r.timestamp_utc for r in rows)
     assert len(rows) == 4
-    assert [call["skip"] for call in client.calls] == [0, 2, 4]
+    assert list(client.after_ts_calls) == [
+        1735689599,
+        1735689720,
+        1735689840,
+    ]
+
+
+class FakeSwapsGraphClient:
+    """Fake Graph client answering both swap queries from canned pages."""
+
+    def __init__(
+        self,
+        pages_by_after_ts: Mapping[int, list[dict[str, Any]]],
+        pages_by_second_cursor: Mapping[tuple[int, str], list[dict[str, Any]]],
+    ) -> None:
+        self._pages_by_after_ts = pages_by_after_ts
+        self._pages_by_second_cursor = pages_by_second_cursor
+
+    def post_json(self, query: str, variables: Mapping[str, Any]) -> dict[str, Any]:
+        del query
+        if "afterId" in variables:
+            key = (int(variables["ts"]), str(variables["afterId"]))
+            page = self._pages_by_second_cursor.get(key, [])
+        else:
+            page = self._pages_by_after_ts.get(int(variables["afterTs"]), [])
+        return {"data": {"swaps": page}}
+
+
+def _swap(swap_id: str, unix_ts: int) -> dict[str, str | int]:
+    return {
+        "id": swap_id,
+        "timestamp": unix_ts,
+        "amount0": "1.0",
+        "amount1": "-1.0",
+        "amountUSD": "10.0",
+        "sqrtPriceX96": "1",
+    }
+
+
+def test_fetch_pool_swaps_raw_drains_dense_boundary_second() -> None:
+    # The first page fills entirely with one second, which used to look
+    # like an all-duplicate page and truncate the rest of the window; the
+    # id cursor must drain that second and then move past it.
+    client = FakeSwapsGraphClient(
+        pages_by_after_ts={
+            1735689599: [_swap("0xa", 1735689600), _swap("0xb", 1735689600)],
+            1735689600: [_swap("0xd", 1735689660)],
+        },
+        pages_by_second_cursor={
+            (1735689600, ""): [_swap("0xa", 1735689600), _swap("0xb", 1735689600)],
+            (1735689600, "0xb"): [_swap("0xc", 1735689600)],
+        },
+    )
+
+    rows = fetch_pool_swaps_raw(
+        client,
+        pool_id="0xPool",
+        start_time_utc=datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
+        end_time_utc=datetime(2025, 1, 1, 0, 10, tzinfo=UTC),
+        page_size=2,
+    )
+
+    assert [row["id"] for row in rows] == ["0xa", "0xb", "0xc", "0xd"]
 
 
 def test_fetch_two_fee_tiers_includes_both_tiers() -> None:
     client = FakeGraphClient(
         {
-            0: [_row(1735689600)],
-            1: [_row(1735689660)],
+            1735689599: [_row(1735689600)],
+            1735689600: [_row(1735689660)],
         }
     )
 
@@ -102,14 +183,13 @@ def test_fetch_two_fee_tiers_includes_both_tiers() -> None:
 
 
 def test_urllib_client_retries_transient_error_then_succeeds() -> None:
-    calls = {"count": 0}
-
-    def _fake_urlopen(*args: Any, **kwargs: Any) -> _FakeResponse:
-        del args, kwargs
-        calls["count"] += 1
-        if calls["count"] < 2:
-            raise error.URLError("temporary")
-        return _FakeResponse('{"data": {"poolMinuteDatas": []}}')
+    # The side-effect queue fails the first call and answers the retry.
+    urlopen_mock = Mock(
+        side_effect=[
+            error.URLError("temporary"),
+            _FakeResponse('{"data": {"poolMinuteDatas": []}}'),
+        ]
+    )
 
     client = UrllibGraphClient(
         endpoint="https://example.com/subgraphs/id/mainnet",
@@ -117,20 +197,15 @@ def test_urllib_client_retries_transient_error_then_succeeds() -> None:
         retry_backoff_seconds=0,
     )
 
-    with patch(
-        "ingestion.sources.uniswap_graph.request.urlopen",
-        side_effect=_fake_urlopen,
-    ):
+    with patch("ingestion.sources.uniswap_graph.request.urlopen", urlopen_mock):
         payload = client.post_json("query", {"pool": "0xpool"})
 
-    assert calls["count"] == 2
+    assert urlopen_mock.call_count == 2
     assert payload["data"]["poolMinuteDatas"] == []
 
 
 def test_urllib_client_raises_after_retry_exhaustion() -> None:
-    def _fake_urlopen(*args: Any, **kwargs: Any) -> _FakeResponse:
-        del args, kwargs
-        raise error.URLError("down")
+    urlopen_mock = Mock(side_effect=error.URLError("down"))
 
     client = UrllibGraphClient(
         endpoint="https://example.com/subgraphs/id/mainnet",
@@ -138,10 +213,7 @@ def test_urllib_client_raises_after_retry_exhaustion() -> None:
         retry_backoff_seconds=0,
     )
 
-    with patch(
-        "ingestion.sources.uniswap_graph.request.urlopen",
-        side_effect=_fake_urlopen,
-    ):
+    with patch("ingestion.sources.uniswap_graph.request.urlopen", urlopen_mock):
         with pytest.raises(error.URLError):
             client.post_json("query", {"pool": "0xpool"})
 
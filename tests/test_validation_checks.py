@@ -2,9 +2,21 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
+
+import pyarrow as pa
 import pytest
 
-from ingestion.validation import ValidationError, enforce_validation, validate_records
+from ingestion import validation
+from ingestion.validation import (
+    VECTORIZED_MIN_ROWS,
+    ValidationError,
+    enforce_validation,
+    validate_records,
+    validate_records_arrow,
+    validate_records_parallel,
+    validate_records_vectorized,
+)
 
 
 def test_validate_records_detects_non_monotonic_timestamp() -> None:
@@ -52,6 +64,88 @@ def test_enforce_validation_soft_warning_vs_hard_fail() -> None:
         )
 
 
+def test_validate_records_arrow_detects_timestamp_and_range_issues() -> None:
+    batch = pa.record_batch(
+        {
+            "minute_utc": pa.array(
+                [
+                    datetime(2025, 1, 1, 0, 1, tzinfo=UTC),
+                    datetime(2025, 1, 1, 0, 0, tzinfo=UTC),
+                ],
+                type=pa.timestamp("us", tz="UTC"),
+            ),
+            "coinbase_close": pa.array([100.0, -1.0]),
+        }
+    )
+
+    issues = validate_records_arrow(
+        batch, numeric_ranges={"coinbase_close": (0.0, None)}
+    )
+
+    codes = {issue.code for issue in issues}
+    assert "non_monotonic_timestamp" in codes
+    assert "value_below_min" in codes
+
+
+def test_validate_records_vectorized_matches_scalar_issue_for_issue() -> None:
+    # Large enough to take the vectorized branch, with every timestamp
+    # failure mode the scalar path rejects seeded into specific rows.
+    rows: list[dict[str, object]] = [
+        {"minute_utc": f"2025-01-01T{idx // 60:02d}:{idx % 60:02d}:00Z"}
+        for idx in range(VECTORIZED_MIN_ROWS)
+    ]
+    rows[3]["minute_utc"] = None
+    rows[5]["minute_utc"] = "01/02/2025"
+    rows[7]["minute_utc"] = "2025-01-01T00:00:30Z"
+    rows[9]["coinbase_close"] = -1.0
+
+    kwargs = {"numeric_ranges": {"coinbase_close": (0.0, None)}}
+    vectorized = validate_records_vectorized(rows, **kwargs)
+    scalar = validate_records(rows, **kwargs)
+
+    assert [(issue.severity, issue.code) for issue in vectorized] == [
+        (issue.severity, issue.code) for issue in scalar
+    ]
+    codes = [issue.code for issue in vectorized]
+    assert codes.count("invalid_timestamp") == 2
+    assert "non_monotonic_timestamp" in codes
+    assert "value_below_min" in codes
+
+
+def test_validate_records_parallel_matches_serial(monkeypatch) -> None:
+    # Lowering the threshold exercises the pool sharding, the global index
+    # offsetting, and the parent-side monotonicity reduction without a
+    # 200k-row fixture.
+    monkeypatch.setattr(validation, "PARALLEL_MIN_ROWS", 8)
+
+    rows: list[dict[str, object]] = [
+        {"minute_utc": f"2025-01-01T00:{idx:02d}:00Z", "coinbase_close": 100.0 + idx}
+        for idx in range(12)
+    ]
+    rows[2]["coinbase_close"] = -1.0
+    rows[5]["minute_utc"] = "2025-01-01T00:03:30Z"
+    rows[7]["coinbase_close"] = None
+    rows[8]["coinbase_close"] = None
+    del rows[9]["coinbase_close"]
+
+    kwargs = {
+        "required_columns": {"minute_utc", "coinbase_close"},
+        "numeric_ranges": {"coinbase_close": (0.0, None)},
+        "warning_missing_thresholds": {"coinbase_close": 0.1},
+    }
+    parallel = validate_records_parallel(rows, n_workers=2, chunk_size=5, **kwargs)
+    serial = validate_records(rows, **kwargs)
+
+    assert parallel == serial
+    codes = {issue.code for issue in parallel}
+    assert codes >= {
+        "value_below_min",
+        "non_monotonic_timestamp",
+        "missing_required_columns",
+        "high_missingness",
+    }
+
+
 def test_validate_records_required_columns() -> None:
     rows = [{"minute_utc": "2025-01-01T00:00:00Z"}]
 